@@ -8,19 +8,24 @@ Usage:
 """
 
 import streamlit as st
+import itertools
+import os
 import sys
 import uuid
-from pathlib import Path
+from collections import deque
 
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
+_HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, _HERE)
 
-from src.vector_store import VectorStoreManager
-from src.llm_chain import LLMChainManager
-from src.conversation import ConversationManager
-from src.tts import TTSManager
-from src.chat_storage import ChatStorageManager
-from src.utils import load_env_file, format_error_message
+from src.conversation import ConversationManager, MessageLog
+from src.resources import (
+    get_llm_manager,
+    get_tts_manager,
+    get_chat_storage,
+    get_background_executor
+)
+from src.utils import format_error_message
 
 # Import UI components
 from src.ui import (
@@ -31,6 +36,8 @@ from src.ui import (
     display_welcome_screen,
     save_current_chat
 )
+from src.ui.i18n import get_strings
+from src.ui.session_manager import MESSAGE_HISTORY_CAP, RECENT_CHATS_CAP
 
 
 # Page configuration
@@ -42,26 +49,10 @@ st.set_page_config(
 )
 
 
-@st.cache_resource
-def initialize_components():
-    """Initialize all components (cached)"""
-    print("\n[APP] Starting initialization...")
-    load_env_file()
-    
-    # Initialize components (silent mode)
-    vs_manager = VectorStoreManager(verbose=False)
-    llm_manager = LLMChainManager(vs_manager, verbose=False)
-    tts_manager = TTSManager()
-    chat_storage = ChatStorageManager()
-    
-    print("[APP] ✅ All components initialized successfully\n")
-    return vs_manager, llm_manager, tts_manager, chat_storage
-
-
 def initialize_session_state():
     """Initialize all session state variables"""
     if "messages" not in st.session_state:
-        st.session_state.messages = []
+        st.session_state.messages = MessageLog(maxlen=MESSAGE_HISTORY_CAP)
     
     if "conversation_manager" not in st.session_state:
         st.session_state.conversation_manager = ConversationManager()
@@ -84,22 +75,70 @@ def initialize_session_state():
     if "chat_sessions" not in st.session_state:
         st.session_state.chat_sessions = {}
 
+    if "tts_futures" not in st.session_state:
+        st.session_state.tts_futures = {}
+
+
+# How many recent messages render inline; older ones go behind an expander
+RECENT_RENDER_WINDOW = 20
+
+# Answers that are apologies / dead ends don't warrant follow-up suggestions
+_NO_FOLLOWUP_HINTS = ("sorry", "i don't know", "xin lỗi", "không biết")
+
+
+def _should_suggest_followups(answer: str, function_called) -> bool:
+    """Cheap heuristic to skip the follow-up LLM call on dead-end turns
+
+    Args:
+        answer: Final assistant answer
+        function_called: Name of the called function, if any
+
+    Returns:
+        True if follow-up questions are worth generating
+    """
+    if len(answer.split()) < 15:
+        return False
+    if function_called is None:
+        lower = answer.lower()
+        if any(hint in lower for hint in _NO_FOLLOWUP_HINTS):
+            return False
+    return True
+
 
+@st.fragment
 def process_user_input(user_input: str, llm_manager, tts_manager):
     """Process user input and generate response
-    
+
+    Runs as a fragment so the streaming answer and its widgets stay
+    scoped to this block. Follow-up suggestions render inline here, so no
+    full-script rerun is needed at the end of a turn; the sidebar and
+    history pane catch up on the next app rerun (e.g. the next input).
+
     Args:
         user_input: User's input message
         llm_manager: LLM chain manager
         tts_manager: TTS manager
     """
-    ui_lang = st.session_state.ui_lang
-    
+    # Fragment reruns (a click on any widget below, e.g. a follow-up
+    # suggestion) replay this function with the original arguments. Each
+    # turn is processed exactly once: replayed runs skip straight to the
+    # widgets so the turn isn't appended, generated and saved twice. The
+    # turn id is stamped in main() on each real submission.
+    turn_id = st.session_state.get("_live_turn_id")
+    if st.session_state.get("_live_turn_done") == turn_id:
+        if st.session_state.followup_questions:
+            display_followup_questions(
+                st.session_state.followup_questions,
+                st.session_state.current_language,
+                key_ns=f"live_{len(st.session_state.messages)}"
+            )
+        return
+    st.session_state._live_turn_done = turn_id
+
+    t = get_strings(st.session_state.ui_lang)
+
     # Add user message to chat
-    st.session_state.messages.append({
-        "role": "user",
-        "content": user_input
-    })
+    st.session_state.messages.append("user", user_input)
     st.session_state.conversation_manager.add_message("user", user_input)
     
     # Display user message
@@ -108,64 +147,131 @@ def process_user_input(user_input: str, llm_manager, tts_manager):
     
     # Generate response
     with st.chat_message("assistant"):
-        thinking_msg = "Thinking..." if ui_lang == "en" else "Đang suy nghĩ..."
-        with st.spinner(thinking_msg):
-            try:
-                # Get chat history
-                chat_history = st.session_state.conversation_manager.get_history(last_n=5)
-                
-                # Run LLM chain
-                result = llm_manager.run_chain(user_input, chat_history)
-                
-                answer = result["answer"]
-                language = result["language"]
-                function_called = result.get("function_called")
-                
-                # Display answer
-                st.markdown(answer)
-                
-                # Show function call info if any
-                if function_called:
-                    expander_title = "🔗 External Links Retrieved" if ui_lang == "en" else "🔗 Liên kết bên ngoài"
-                    with st.expander(expander_title):
-                        st.info(f"Function called: `{function_called}`")
-                        st.markdown(result.get("function_result", ""))
-                
-                # Add assistant message to chat
-                st.session_state.messages.append({
-                    "role": "assistant",
-                    "content": answer,
-                    "language": language
-                })
-                st.session_state.conversation_manager.add_message("assistant", answer)
-                st.session_state.current_language = language
-                
-                # Save current chat session
-                save_current_chat()
-                
-                # Generate follow-up questions
+        try:
+            # Get chat history
+            chat_history = st.session_state.conversation_manager.get_history(last_n=5)
+
+            # Stream the LLM answer into the chat bubble
+            meta = {}
+            stream = llm_manager.run_chain_stream(user_input, chat_history, meta)
+
+            # Spinner only covers retrieval + time-to-first-token
+            with st.spinner(t["thinking"]):
+                first_chunk = next(stream, "")
+
+            # st.write_stream flushes chunks to the browser as they arrive
+            streamed = st.write_stream(itertools.chain([first_chunk], stream))
+
+            answer = meta.get("answer") or (streamed if isinstance(streamed, str) else "")
+            language = meta.get("language", "english")
+            function_called = meta.get("function_called")
+
+            # Show function call info if any
+            if function_called:
+                with st.expander(t["external_links"]):
+                    st.info(f"Function called: `{function_called}`")
+                    st.markdown(meta.get("function_result", ""))
+
+            # Add assistant message to chat; the returned id stays valid
+            # even after the log starts evicting from the front
+            message_id = st.session_state.messages.append(
+                "assistant", answer, language
+            )
+            st.session_state.conversation_manager.add_message("assistant", answer)
+            st.session_state.current_language = language
+
+            # Follow-ups normally arrive batched with the answer itself;
+            # only fall back to a second LLM call when parsing failed and
+            # the answer actually invites a continuation
+            followup_future = None
+            if meta.get("followup_questions") is None and \
+                    _should_suggest_followups(answer, function_called):
+                followup_future = get_background_executor().submit(
+                    llm_manager.generate_followup_questions,
+                    user_input, answer, language
+                )
+
+            # Pre-synthesize TTS audio so the 🔊 button is instantaneous
+            if tts_manager.is_available():
+                st.session_state.tts_futures[message_id] = get_background_executor().submit(
+                    tts_manager.text_to_speech, answer, language
+                )
+
+            # Save current chat session
+            save_current_chat()
+
+            # Collect follow-up questions
+            if followup_future is None:
+                st.session_state.followup_questions = meta.get("followup_questions") or []
+            else:
                 try:
-                    followup_questions = llm_manager.generate_followup_questions(
-                        user_input, answer, language
-                    )
-                    st.session_state.followup_questions = followup_questions
+                    st.session_state.followup_questions = followup_future.result(timeout=15)
                 except Exception as e:
                     print(f"Failed to generate follow-up questions: {e}")
                     st.session_state.followup_questions = []
-                
-            except Exception as e:
-                error_msg = format_error_message(e, st.session_state.current_language)
-                st.error(error_msg)
-                
-                # Add error message
-                st.session_state.messages.append({
-                    "role": "assistant",
-                    "content": error_msg,
-                    "language": st.session_state.current_language
-                })
-    
-    # Rerun to show follow-up questions
-    st.rerun()
+
+            # Show suggestions right here instead of rerunning the whole
+            # script just to reach the history pane's renderer
+            if st.session_state.followup_questions:
+                display_followup_questions(
+                    st.session_state.followup_questions, language,
+                    key_ns=f"live_{len(st.session_state.messages)}"
+                )
+
+        except Exception as e:
+            error_msg = format_error_message(e, st.session_state.current_language)
+            st.error(error_msg)
+
+            # Add error message
+            st.session_state.messages.append(
+                "assistant", error_msg, st.session_state.current_language
+            )
+
+
+@st.fragment
+def render_history():
+    """Render the chat history and follow-up suggestions
+
+    Wrapped in st.fragment so interactions inside the history pane (e.g.
+    TTS buttons) rerun only this block instead of the whole script.
+    """
+    tts_manager = get_tts_manager()
+
+    # Display chat history (availability checked once, not per message)
+    tts_ok = tts_manager.is_available()
+
+    def _render(message):
+        # Stable id from the log, not the render index: positional keys
+        # would shift once the capped log evicts from the front
+        display_message(
+            role=message["role"],
+            content=message["content"],
+            show_tts=message["role"] == "assistant" and tts_ok,
+            language=message.get("language", "english"),
+            message_id=message["id"]
+        )
+
+    # Only the recent window renders inline, so per-rerun cost stays flat
+    # as the conversation grows; older turns sit behind a collapsed
+    # expander whose body Streamlit only materializes when opened
+    messages = list(st.session_state.messages)
+    split = max(0, len(messages) - RECENT_RENDER_WINDOW)
+
+    if split:
+        t = get_strings(st.session_state.ui_lang)
+        with st.expander(t["show_earlier"].format(n=split)):
+            for message in messages[:split]:
+                _render(message)
+
+    for message in messages[split:]:
+        _render(message)
+
+    # Display follow-up questions after last message
+    if st.session_state.followup_questions:
+        display_followup_questions(
+            st.session_state.followup_questions,
+            st.session_state.current_language
+        )
 
 
 def main():
@@ -174,17 +280,19 @@ def main():
     # Initialize session state
     initialize_session_state()
     
-    # Initialize components
+    # Only the session index is needed to paint the first frame; the LLM
+    # and TTS singletons are built lazily when the first message arrives
     try:
-        vs_manager, llm_manager, tts_manager, chat_storage = initialize_components()
-        st.session_state.vs_manager = vs_manager
-        st.session_state.llm_manager = llm_manager
-        st.session_state.tts_manager = tts_manager
-        st.session_state.chat_storage = chat_storage
-        
-        # Load all chat sessions from file system (only once)
+        # Load the chat session index from file system (only once);
+        # full sessions are fetched on demand when selected
         if "chat_sessions_loaded" not in st.session_state:
-            st.session_state.chat_sessions = chat_storage.load_all_sessions()
+            index = get_chat_storage().load_session_index()
+            st.session_state.chat_sessions = index
+            # Seed the sidebar recency order, newest first
+            recent = sorted(index, key=lambda sid: index[sid].get("timestamp", ""))
+            st.session_state.chat_order = deque(
+                reversed(recent[-RECENT_CHATS_CAP:]), maxlen=RECENT_CHATS_CAP
+            )
             st.session_state.chat_sessions_loaded = True
     except Exception as e:
         st.error(f"❌ Failed to initialize system: {str(e)}")
@@ -201,36 +309,30 @@ def main():
     if not st.session_state.messages:
         display_welcome_screen()
     else:
-        # Display chat history
-        for i, message in enumerate(st.session_state.messages):
-            display_message(
-                role=message["role"],
-                content=message["content"],
-                show_tts=message["role"] == "assistant" and tts_manager.is_available(),
-                language=message.get("language", "english"),
-                message_id=f"msg_{i}"
-            )
-        
-        # Display follow-up questions after last message
-        if st.session_state.followup_questions:
-            display_followup_questions(
-                st.session_state.followup_questions,
-                st.session_state.current_language
-            )
+        render_history()
     
     # Chat input (always visible at bottom)
-    ui_lang = st.session_state.ui_lang
-    placeholder = "Type your question here..." if ui_lang == "en" else "Nhập câu hỏi của bạn..."
-    
-    user_input = st.chat_input(placeholder, key="chat_input")
+    t = get_strings(st.session_state.ui_lang)
+
+    user_input = st.chat_input(t["placeholder"], key="chat_input")
     
     # Handle example question clicks
     if st.session_state.current_input:
         user_input = st.session_state.current_input
         st.session_state.current_input = ""
     
-    # Process user input
+    # Process user input (constructs the LLM/TTS singletons on first use)
     if user_input:
+        try:
+            llm_manager = get_llm_manager()
+            tts_manager = get_tts_manager()
+        except Exception as e:
+            st.error(f"❌ Failed to initialize system: {str(e)}")
+            st.info("Please check your .env configuration and ensure all API keys are set correctly.")
+            st.stop()
+        # Fresh turn id so the fragment knows this is a real submission,
+        # not a fragment replay of the previous one
+        st.session_state._live_turn_id = uuid.uuid4().hex
         process_user_input(user_input, llm_manager, tts_manager)
 
 
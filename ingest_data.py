@@ -76,7 +76,9 @@ def main():
     try:
         # Set force_recreate=True to delete and recreate index with new embedding model
         force_recreate = os.getenv("FORCE_RECREATE_INDEX", "false").lower() == "true"
-        vs_manager.create_index_if_not_exists(dimension=1536, force_recreate=force_recreate)
+        # Dimension follows the manager config (EMBEDDING_DIMENSIONS or
+        # the model's native 1536)
+        vs_manager.create_index_if_not_exists(force_recreate=force_recreate)
         print("✅ Pinecone index ready")
     except Exception as e:
         print(f"❌ Failed to create Pinecone index: {e}")
@@ -120,7 +122,8 @@ def main():
     print("\n7. Chunking documents...")
     try:
         chunks = vs_manager.chunk_documents(all_docs, chunk_size=1000, chunk_overlap=200)
-        print(f"✅ Created {len(chunks)} chunks")
+        chunks = vs_manager.dedupe_chunks(chunks)
+        print(f"✅ Created {len(chunks)} unique chunks")
     except Exception as e:
         print(f"❌ Failed to chunk documents: {e}")
         sys.exit(1)
@@ -6,10 +6,39 @@ using JSON format for persistence across sessions.
 
 import json
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
+try:
+    # orjson parses/serializes several times faster than stdlib json and
+    # emits UTF-8 natively; fall back silently when it isn't installed
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Strips everything that isn't filesystem-safe from a session id; the
+# compiled pattern replaces a per-character Python-level generator scan
+_SAFE_ID_RE = re.compile(r"[^A-Za-z0-9_-]")
+
+
+def _dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to a JSON string, preferring orjson"""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+
+def _loads(data) -> Any:
+    """Parse a JSON string/bytes, preferring orjson"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class ChatStorageManager:
     """Manages chat session storage in file system"""
@@ -21,6 +50,9 @@ class ChatStorageManager:
             storage_dir: Directory to store chat session files
         """
         self.storage_dir = Path(storage_dir)
+        # Per-session parse cache keyed by file mtimes; a session is only
+        # re-read from disk when its files actually changed
+        self._cache: Dict[str, tuple] = {}
         self._ensure_storage_dir()
     
     def _ensure_storage_dir(self):
@@ -30,21 +62,100 @@ class ChatStorageManager:
         # Create .gitignore to avoid committing chat history
         gitignore_path = self.storage_dir / ".gitignore"
         if not gitignore_path.exists():
-            gitignore_path.write_text("# Ignore all chat history files\n*.json\n")
-    
+            gitignore_path.write_text(
+                "# Ignore all chat history files\n*.json\n*.jsonl\n.tts_cache/\n"
+            )
+
+    def _safe_id(self, session_id: str) -> str:
+        """Sanitize a session_id to be filesystem-safe"""
+        return _SAFE_ID_RE.sub("", session_id)
+
     def _get_session_file_path(self, session_id: str) -> Path:
-        """Get file path for a session
-        
+        """Get file path for a legacy full-session file
+
         Args:
             session_id: Unique session identifier
-            
+
         Returns:
             Path object for the session file
         """
-        # Sanitize session_id to be filesystem-safe
-        safe_id = "".join(c for c in session_id if c.isalnum() or c in ('-', '_'))
-        return self.storage_dir / f"{safe_id}.json"
-    
+        return self.storage_dir / f"{self._safe_id(session_id)}.json"
+
+    def _get_log_file_path(self, session_id: str) -> Path:
+        """Get file path for the append-only message log of a session"""
+        return self.storage_dir / f"{self._safe_id(session_id)}.jsonl"
+
+    def _get_meta_file_path(self, session_id: str) -> Path:
+        """Get file path for the small per-session metadata file"""
+        return self.storage_dir / f"{self._safe_id(session_id)}.meta.json"
+
+    def append_message(self, session_id: str, message: Dict) -> bool:
+        """Append one message to the session's JSONL log
+
+        O(1) per turn regardless of conversation length, unlike rewriting
+        the full session JSON.
+
+        Args:
+            session_id: Unique session identifier
+            message: Message dictionary (role/content/...)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with open(self._get_log_file_path(session_id), 'a', encoding='utf-8') as f:
+                f.write(_dumps(message) + "\n")
+            return True
+        except Exception as e:
+            print(f"[ChatStorage] Error appending to session {session_id}: {e}")
+            return False
+
+    def write_log(self, session_id: str, messages: List[Dict]) -> bool:
+        """Rewrite the session's JSONL log from scratch
+
+        Used when the in-memory history no longer matches the log tail
+        (e.g. the bounded deque started evicting old messages).
+
+        Args:
+            session_id: Unique session identifier
+            messages: Full list of message dictionaries
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with open(self._get_log_file_path(session_id), 'w', encoding='utf-8') as f:
+                for message in messages:
+                    f.write(_dumps(message) + "\n")
+            return True
+        except Exception as e:
+            print(f"[ChatStorage] Error writing log for session {session_id}: {e}")
+            return False
+
+    def update_meta(self, session_id: str, meta: Dict) -> bool:
+        """Write the tiny per-session metadata file
+
+        Args:
+            session_id: Unique session identifier
+            meta: Metadata dictionary (preview, timestamp, followup_questions)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            meta_with_id = {"session_id": session_id, **meta}
+            meta_path = self._get_meta_file_path(session_id)
+            # Write-then-rename so a crash mid-write can't leave a
+            # truncated meta file behind
+            tmp_path = meta_path.with_suffix(".json.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(_dumps(meta_with_id, indent=True))
+            os.replace(tmp_path, meta_path)
+            return True
+        except Exception as e:
+            print(f"[ChatStorage] Error updating meta for session {session_id}: {e}")
+            return False
+
     def save_session(self, session_id: str, session_data: Dict) -> bool:
         """Save a chat session to file
         
@@ -68,7 +179,7 @@ class ChatStorageManager:
             
             # Write to file
             with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(session_data_with_meta, f, ensure_ascii=False, indent=2)
+                f.write(_dumps(session_data_with_meta, indent=True))
             
             return True
         except Exception as e:
@@ -77,27 +188,140 @@ class ChatStorageManager:
     
     def load_session(self, session_id: str) -> Optional[Dict]:
         """Load a chat session from file
-        
+
+        Replays the JSONL message log when one exists; falls back to the
+        legacy full-session JSON format otherwise.
+
         Args:
             session_id: Unique session identifier
-            
+
         Returns:
             Session data dictionary or None if not found
         """
         try:
+            log_path = self._get_log_file_path(session_id)
+            meta_path = self._get_meta_file_path(session_id)
+            legacy_path = self._get_session_file_path(session_id)
+
+            stamp = tuple(
+                p.stat().st_mtime if p.exists() else None
+                for p in (log_path, meta_path, legacy_path)
+            )
+            cached = self._cache.get(session_id)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+
+            data = self._read_session(session_id)
+            if data is not None:
+                self._cache[session_id] = (stamp, data)
+            return data
+        except Exception as e:
+            print(f"[ChatStorage] Error loading session {session_id}: {e}")
+            return None
+
+    def _read_session(self, session_id: str) -> Optional[Dict]:
+        """Read a session from disk, bypassing the mtime cache"""
+        try:
+            log_path = self._get_log_file_path(session_id)
+            if log_path.exists():
+                with open(log_path, 'r', encoding='utf-8') as f:
+                    messages = [_loads(line) for line in f if line.strip()]
+
+                meta = {}
+                meta_path = self._get_meta_file_path(session_id)
+                if meta_path.exists():
+                    with open(meta_path, 'r', encoding='utf-8') as f:
+                        meta = _loads(f.read())
+
+                return {
+                    "messages": messages,
+                    "followup_questions": meta.get("followup_questions", []),
+                    "preview": meta.get("preview", "New conversation"),
+                    "timestamp": meta.get("timestamp", "")
+                }
+
+            # Legacy format: one JSON file holding the whole session
             file_path = self._get_session_file_path(session_id)
-            
             if not file_path.exists():
                 return None
-            
+
             with open(file_path, 'r', encoding='utf-8') as f:
-                session_data_with_meta = json.load(f)
-            
+                session_data_with_meta = _loads(f.read())
+
             return session_data_with_meta.get("data")
         except Exception as e:
             print(f"[ChatStorage] Error loading session {session_id}: {e}")
             return None
     
+    def load_session_index(self) -> Dict[str, Dict]:
+        """Load lightweight metadata for all stored sessions
+
+        Only the preview and timestamp needed by the sidebar are kept in
+        memory; full message lists are fetched on demand via load_session.
+
+        Returns:
+            Dictionary mapping session_id to {preview, timestamp}
+        """
+        def _index_meta(file_path: Path):
+            try:
+                with open(file_path, 'rb') as f:
+                    meta = _loads(f.read())
+                session_id = meta.get("session_id")
+                if session_id:
+                    return session_id, {
+                        "preview": meta.get("preview", "New conversation"),
+                        "timestamp": meta.get("timestamp", "")
+                    }
+            except Exception as e:
+                print(f"[ChatStorage] Error indexing file {file_path}: {e}")
+            return None
+
+        def _index_legacy(file_path: Path):
+            try:
+                with open(file_path, 'rb') as f:
+                    session_data_with_meta = _loads(f.read())
+                session_id = session_data_with_meta.get("session_id")
+                session_data = session_data_with_meta.get("data") or {}
+                if session_id:
+                    return session_id, {
+                        "preview": session_data.get("preview", "New conversation"),
+                        "timestamp": session_data.get("timestamp", "")
+                    }
+            except Exception as e:
+                print(f"[ChatStorage] Error indexing file {file_path}: {e}")
+            return None
+
+        index = {}
+
+        try:
+            meta_paths = list(self.storage_dir.glob("*.meta.json"))
+            legacy_paths = [
+                p for p in self.storage_dir.glob("*.json")
+                if not p.name.endswith(".meta.json")
+            ]
+
+            # The GIL is released during file reads, so parsing the
+            # per-session files in a thread pool overlaps the syscalls
+            n_files = len(meta_paths) + len(legacy_paths)
+            if n_files:
+                with ThreadPoolExecutor(max_workers=min(16, n_files)) as ex:
+                    meta_entries = list(ex.map(_index_meta, meta_paths))
+                    legacy_entries = list(ex.map(_index_legacy, legacy_paths))
+
+                # New-format sessions win over unmigrated legacy files
+                for entry in meta_entries:
+                    if entry:
+                        index[entry[0]] = entry[1]
+                for entry in legacy_entries:
+                    if entry and entry[0] not in index:
+                        index[entry[0]] = entry[1]
+
+            print(f"[ChatStorage] Indexed {len(index)} chat sessions")
+            return index
+        except Exception as e:
+            print(f"[ChatStorage] Error building session index: {e}")
+            return {}
+
     def load_all_sessions(self) -> Dict[str, Dict]:
         """Load all chat sessions from storage
         
@@ -113,7 +337,7 @@ class ChatStorageManager:
             for file_path in json_files:
                 try:
                     with open(file_path, 'r', encoding='utf-8') as f:
-                        session_data_with_meta = json.load(f)
+                        session_data_with_meta = _loads(f.read())
                     
                     session_id = session_data_with_meta.get("session_id")
                     session_data = session_data_with_meta.get("data")
@@ -140,12 +364,17 @@ class ChatStorageManager:
             True if successful, False otherwise
         """
         try:
-            file_path = self._get_session_file_path(session_id)
-            
-            if file_path.exists():
-                file_path.unlink()
-                return True
-            return False
+            self._cache.pop(session_id, None)
+            deleted = False
+            for file_path in (
+                self._get_session_file_path(session_id),
+                self._get_log_file_path(session_id),
+                self._get_meta_file_path(session_id),
+            ):
+                if file_path.exists():
+                    file_path.unlink()
+                    deleted = True
+            return deleted
         except Exception as e:
             print(f"[ChatStorage] Error deleting session {session_id}: {e}")
             return False
@@ -157,20 +386,20 @@ class ChatStorageManager:
             List of session IDs
         """
         try:
-            json_files = list(self.storage_dir.glob("*.json"))
-            session_ids = []
-            
-            for file_path in json_files:
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        session_data_with_meta = json.load(f)
-                    session_id = session_data_with_meta.get("session_id")
-                    if session_id:
-                        session_ids.append(session_id)
-                except:
-                    continue
-            
-            return session_ids
+            # Session ids are the filename stems, so no file needs to be
+            # opened or parsed here
+            session_ids = set()
+
+            for file_path in self.storage_dir.glob("*.jsonl"):
+                session_ids.add(file_path.stem)
+            for file_path in self.storage_dir.glob("*.json"):
+                name = file_path.name
+                if name.endswith(".meta.json"):
+                    session_ids.add(name[:-len(".meta.json")])
+                else:
+                    session_ids.add(file_path.stem)
+
+            return sorted(session_ids)
         except Exception as e:
             print(f"[ChatStorage] Error getting session IDs: {e}")
             return []
@@ -182,10 +411,11 @@ class ChatStorageManager:
             Number of sessions deleted
         """
         try:
-            json_files = list(self.storage_dir.glob("*.json"))
+            session_files = list(self.storage_dir.glob("*.json")) + \
+                list(self.storage_dir.glob("*.jsonl"))
             count = 0
-            
-            for file_path in json_files:
+
+            for file_path in session_files:
                 try:
                     file_path.unlink()
                     count += 1
@@ -1,23 +1,133 @@
 """Conversation Management for Chat History"""
 
-from typing import List, Dict, Any
+import itertools
+import uuid
+from collections import deque
+from typing import Deque, List, Dict, Any, Iterator, Optional
+
+
+# Display names for context formatting; a dict lookup replaces the
+# per-message conditional in the hot path
+_ROLE = {"user": "User", "assistant": "Assistant"}
+
+
+class MessageLog:
+    """Column-oriented store for the UI message list
+
+    Keeps roles, contents and languages in three parallel lists instead
+    of one dict per message, cutting the per-message overhead (dict
+    header + repeated key slots) roughly threefold for long chats.
+    Iteration and indexing still hand out plain dicts so render code is
+    unchanged.
+    """
+
+    def __init__(self, maxlen: Optional[int] = None):
+        """Initialize an empty log
+
+        Args:
+            maxlen: Optional cap; the oldest messages are dropped once
+                the log exceeds it
+        """
+        self.maxlen = maxlen
+        self.roles: List[str] = []
+        self.contents: List[str] = []
+        self.languages: List[Optional[str]] = []
+        # Stable per-message ids: eviction from the front shifts every
+        # positional index, so anything keyed by position (TTS futures,
+        # cached audio) would drift onto the wrong message
+        self.ids: List[str] = []
+
+    def append(self, role: str, content: str, language: Optional[str] = None,
+               message_id: Optional[str] = None) -> str:
+        """Append a message
+
+        Args:
+            role: 'user' or 'assistant'
+            content: Message content
+            language: Message language, if known
+            message_id: Stable id; assigned if not provided
+
+        Returns:
+            The message's stable id
+        """
+        message_id = message_id or uuid.uuid4().hex
+        self.roles.append(role)
+        self.contents.append(content)
+        self.languages.append(language)
+        self.ids.append(message_id)
+        if self.maxlen is not None and len(self.roles) > self.maxlen:
+            excess = len(self.roles) - self.maxlen
+            del self.roles[:excess]
+            del self.contents[:excess]
+            del self.languages[:excess]
+            del self.ids[:excess]
+        return message_id
+
+    def _as_dict(self, i: int) -> Dict[str, str]:
+        msg = {"role": self.roles[i], "content": self.contents[i],
+               "id": self.ids[i]}
+        if self.languages[i] is not None:
+            msg["language"] = self.languages[i]
+        return msg
+
+    def __getitem__(self, i: int) -> Dict[str, str]:
+        return self._as_dict(i)
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        for i in range(len(self.roles)):
+            yield self._as_dict(i)
+
+    def __len__(self) -> int:
+        return len(self.roles)
+
+    def to_list(self) -> List[Dict[str, str]]:
+        """Materialize the log as a list of message dicts"""
+        return list(self)
+
+    @classmethod
+    def from_list(cls, messages: List[Dict[str, Any]],
+                  maxlen: Optional[int] = None) -> "MessageLog":
+        """Build a log from a list of message dicts
+
+        Args:
+            messages: Message dictionaries with role/content keys
+            maxlen: Optional cap applied to the new log
+
+        Returns:
+            Populated MessageLog
+        """
+        log = cls(maxlen=maxlen)
+        for m in messages:
+            # Ids persisted with the session survive reloads; messages
+            # saved before ids existed get a fresh one
+            log.append(m["role"], m["content"], m.get("language"), m.get("id"))
+        return log
+
+    def clear(self):
+        """Remove all messages"""
+        del self.roles[:]
+        del self.contents[:]
+        del self.languages[:]
+        del self.ids[:]
 
 
 class ConversationManager:
     """Manages conversation history and context"""
-    
+
     def __init__(self, max_history: int = 10):
         """Initialize conversation manager
-        
+
         Args:
             max_history: Maximum number of messages to keep in history
         """
         self.max_history = max_history
-        self.messages: List[Dict[str, str]] = []
-    
+        # Bounded deque: append is O(1) and old messages are evicted
+        # automatically, no re-slicing needed
+        self.messages: Deque[Dict[str, str]] = deque(maxlen=max_history)
+
     def add_message(self, role: str, content: str):
         """Add a message to history
-        
+
         Args:
             role: 'user' or 'assistant'
             content: Message content
@@ -26,25 +136,36 @@ class ConversationManager:
             "role": role,
             "content": content
         })
-        
-        # Trim history if too long
-        if len(self.messages) > self.max_history:
-            self.messages = self.messages[-self.max_history:]
-    
+
     def get_history(self, last_n: int = 5) -> List[Dict[str, str]]:
         """Get conversation history
-        
+
         Args:
             last_n: Number of recent messages to return
-            
+
         Returns:
             List of message dictionaries
         """
-        return self.messages[-last_n:] if self.messages else []
-    
+        start = max(0, len(self.messages) - last_n)
+        return list(itertools.islice(self.messages, start, None))
+
+    def load_history(self, messages: List[Dict[str, Any]]):
+        """Replace history with an existing message list in one step
+
+        Used when restoring a saved session; rebuilding the deque in a
+        single pass avoids N add_message calls.
+
+        Args:
+            messages: List of message dictionaries with role/content keys
+        """
+        self.messages = deque(
+            ({"role": m["role"], "content": m["content"]} for m in messages),
+            maxlen=self.max_history,
+        )
+
     def clear_history(self):
         """Clear all conversation history"""
-        self.messages = []
+        self.messages.clear()
     
     def get_context_string(self, last_n: int = 5) -> str:
         """Get conversation history as a formatted string
@@ -55,17 +176,10 @@ class ConversationManager:
         Returns:
             Formatted conversation string
         """
-        recent_messages = self.get_history(last_n)
-        
-        if not recent_messages:
-            return "No conversation history"
-        
-        context_parts = []
-        for msg in recent_messages:
-            role = "User" if msg["role"] == "user" else "Assistant"
-            context_parts.append(f"{role}: {msg['content']}")
-        
-        return "\n".join(context_parts)
+        return "\n".join(
+            f"{_ROLE.get(msg['role'], 'Other')}: {msg['content']}"
+            for msg in self.get_history(last_n)
+        ) or "No conversation history"
     
     def format_for_display(self) -> List[Dict[str, str]]:
         """Format messages for UI display
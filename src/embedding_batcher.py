@@ -0,0 +1,98 @@
+"""Micro-batching front end for embedding requests
+
+Coalesces embed calls arriving from concurrent Streamlit sessions into a
+single embed_documents request. One HTTPS round-trip to Azure then serves
+every caller in the window, instead of N serial calls paying TLS and
+queueing latency each.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, List
+
+
+class EmbeddingBatcher:
+    """Coalesces concurrent embed_query calls into one embed_documents call
+
+    A daemon worker thread drains the request queue: after the first item
+    arrives it waits up to ``window_ms`` for more (up to ``max_batch``),
+    dedupes identical texts, fires a single embed_documents call, and
+    resolves every waiter's Future. A lone caller therefore pays at most
+    the window in extra latency; concurrent callers share one round-trip.
+    """
+
+    def __init__(self, embeddings: Any, max_batch: int = 64,
+                 window_ms: float = 20.0):
+        """Initialize the batcher and start its worker thread
+
+        Args:
+            embeddings: Embeddings client with an embed_documents method
+            max_batch: Maximum number of texts per batched call
+            window_ms: How long to wait for more requests after the first
+        """
+        self.embeddings = embeddings
+        self.max_batch = max_batch
+        self.window = window_ms / 1000.0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._worker, name="embed-batcher", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, text: str) -> Future:
+        """Enqueue a text for embedding
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Future resolving to the embedding vector
+        """
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def embed(self, text: str) -> List[float]:
+        """Embed a text, blocking until the batched call completes
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+        """
+        return self.submit(text).result()
+
+    def _worker(self):
+        """Drain the queue in batches and resolve waiting futures"""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            # Identical texts share one slot in the API call
+            waiters = {}
+            for text, future in batch:
+                waiters.setdefault(text, []).append(future)
+            texts = list(waiters)
+
+            try:
+                vectors = self.embeddings.embed_documents(texts)
+            except Exception as e:
+                for futures in waiters.values():
+                    for future in futures:
+                        future.set_exception(e)
+                continue
+
+            for text, vector in zip(texts, vectors):
+                for future in waiters[text]:
+                    future.set_result(vector)
@@ -2,12 +2,17 @@
 
 import json
 import os
+from functools import lru_cache
 from typing import List, Dict, Any
 
 
+@lru_cache(maxsize=1)
 def load_mock_links() -> Dict[str, Any]:
     """Load mock links from JSON file
-    
+
+    The file is static at runtime, so the parse is memoized: every
+    function-call round-trip after the first reuses the same dict.
+
     Returns:
         Dictionary of mock links data
     """
@@ -21,6 +26,61 @@ def load_mock_links() -> Dict[str, Any]:
         return json.load(f)
 
 
+@lru_cache(maxsize=1)
+def _build_keyword_index() -> Dict[str, str]:
+    """Build an inverted index from normalized keywords to topic keys
+
+    Built once per process alongside the mock-links cache; lookups become
+    a dict.get instead of a nested scan over every topic's keyword list.
+
+    Returns:
+        Dictionary mapping each normalized keyword (and topic key) to
+        its topic key
+    """
+    index = {}
+    for key, value in load_mock_links().items():
+        index.setdefault(key, key)
+        for keyword in value.get("keywords", []):
+            index.setdefault(keyword.lower().strip(), key)
+    return index
+
+
+def _lookup_topic(normalized: str) -> str:
+    """Resolve a normalized query to a topic key, or None
+
+    Tries an O(1) exact keyword/topic lookup first. The fuzzy fallback
+    scores every candidate instead of returning the first substring hit
+    (which depended on dict insertion order and could pick an accidental
+    match): query-inside-keyword outranks keyword-inside-query, and
+    closer lengths outrank looser containment.
+
+    Args:
+        normalized: Lowercased, stripped query string
+
+    Returns:
+        Best-matching topic key or None
+    """
+    index = _build_keyword_index()
+
+    topic_key = index.get(normalized)
+    if topic_key is not None:
+        return topic_key
+
+    best = None
+    best_score = 0.0
+    for keyword, key in index.items():
+        if normalized in keyword:
+            score = 2.0 + len(normalized) / len(keyword)
+        elif keyword in normalized:
+            score = 1.0 + len(keyword) / len(normalized)
+        else:
+            continue
+        if score > best_score:
+            best_score = score
+            best = key
+    return best
+
+
 def get_external_links(topic: str) -> str:
     """Get external links for a given topic
     
@@ -34,25 +94,20 @@ def get_external_links(topic: str) -> str:
         Formatted string with links and descriptions
     """
     mock_links = load_mock_links()
-    
+
     # Normalize topic (lowercase, replace spaces with underscores)
     normalized_topic = topic.lower().strip().replace(" ", "_")
-    
+
     # Try exact match first
     if normalized_topic in mock_links:
         return format_links(mock_links[normalized_topic])
-    
-    # Try fuzzy matching by checking if normalized_topic is in any key
-    for key, value in mock_links.items():
-        if normalized_topic in key or key in normalized_topic:
-            return format_links(value)
-        
-        # Check keywords
-        keywords = value.get("keywords", [])
-        for keyword in keywords:
-            if normalized_topic in keyword.lower() or keyword.lower() in normalized_topic:
-                return format_links(value)
-    
+
+    # Inverted keyword index: exact hit is O(1), fuzzy fallback is one
+    # flat pass instead of a nested topic x keyword scan
+    topic_key = _lookup_topic(normalized_topic)
+    if topic_key is not None:
+        return format_links(mock_links[topic_key])
+
     # No match found
     return f"No external links found for topic: {topic}"
 
@@ -71,17 +126,18 @@ def format_links(link_data: Dict[str, Any]) -> str:
     
     if not links:
         return "No links available"
-    
-    result = f"External Resources ({link_type}):\n\n"
-    
+
+    # Accumulate parts and join once: O(N) instead of quadratic +=
+    parts = [f"External Resources ({link_type}):\n\n"]
+
     for i, link in enumerate(links, 1):
         source = link.get("source", "Unknown")
         url = link.get("url", "")
         title = link.get("title", "Link")
-        
-        result += f"{i}. **{source}**: [{title}]({url})\n"
-    
-    return result
+
+        parts.append(f"{i}. **{source}**: [{title}]({url})\n")
+
+    return "".join(parts)
 
 
 def search_links_by_keywords(keywords: List[str]) -> str:
@@ -94,31 +150,35 @@ def search_links_by_keywords(keywords: List[str]) -> str:
         Formatted string with matching links
     """
     mock_links = load_mock_links()
-    matched_topics = []
-    
+    index = _build_keyword_index()
+
+    # dict preserves insertion order and deduplicates matched topics
+    matched = {}
     for keyword in keywords:
         normalized_kw = keyword.lower().strip()
-        
-        for key, value in mock_links.items():
-            topic_keywords = value.get("keywords", [])
-            
-            # Check if keyword matches
-            if any(normalized_kw in kw.lower() for kw in topic_keywords):
-                if key not in matched_topics:
-                    matched_topics.append(key)
+
+        topic_key = index.get(normalized_kw)
+        if topic_key is not None:
+            matched[topic_key] = True
+            continue
+
+        for kw, key in index.items():
+            if normalized_kw in kw:
+                matched[key] = True
+    matched_topics = list(matched)
     
     if not matched_topics:
         return f"No links found for keywords: {', '.join(keywords)}"
     
     # Format all matched topics
-    result = f"Found links for {len(matched_topics)} topic(s):\n\n"
-    
+    parts = [f"Found links for {len(matched_topics)} topic(s):\n\n"]
+
     for topic_key in matched_topics:
-        topic_data = mock_links[topic_key]
-        result += f"### {topic_key.replace('_', ' ').title()}\n"
-        result += format_links(topic_data) + "\n"
-    
-    return result
+        parts.append(f"### {topic_key.replace('_', ' ').title()}\n")
+        parts.append(format_links(mock_links[topic_key]))
+        parts.append("\n")
+
+    return "".join(parts)
 
 
 # Define the function schema for OpenAI Function Calling
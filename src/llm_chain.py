@@ -1,14 +1,29 @@
 """Langchain LLM Chain with Azure OpenAI and Function Calling"""
 
+import asyncio
+import hashlib
 import os
 import json
+import re
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from langchain_openai import AzureChatOpenAI
-from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - ships with langchain-openai
+    tiktoken = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 from langchain.schema import HumanMessage, AIMessage, SystemMessage
-from langchain.schema.runnable import RunnablePassthrough, RunnableParallel
-from langchain.schema.output_parser import StrOutputParser
 
+from src.embedding_batcher import EmbeddingBatcher
+from src.router import needs_retrieval
+from src.semantic_cache import SemanticCache
 from src.vector_store import VectorStoreManager
 from src.function_calls import (
     get_external_links, 
@@ -17,6 +32,100 @@ from src.function_calls import (
 )
 
 
+# Marker the model uses to append follow-up suggestions to its answer
+FOLLOWUP_MARKER = "FOLLOWUPS:"
+
+# Fast path for parsing model-emitted function arguments
+_loads_args = orjson.loads if orjson is not None else json.loads
+
+# Retrieval exposed as a tool: on turns where the router skipped eager
+# retrieval, the model can still pull knowledge-base facts on demand
+# instead of guessing or apologizing
+SEARCH_KB_SCHEMA = {
+    "name": "search_knowledge_base",
+    "description": """Search the Vietnam travel knowledge base for factual information
+    about destinations, food, culture, and travel tips.
+    Use this function when the provided context says no retrieval was performed
+    but you need knowledge-base facts to answer accurately.""",
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Search query describing the information needed"
+            }
+        },
+        "required": ["query"]
+    }
+}
+
+
+# Hard cap on knowledge-base context fed to the model; anything beyond
+# this is truncated rather than paid for token by token
+_CONTEXT_TOKEN_BUDGET = int(os.getenv("CONTEXT_TOKEN_BUDGET", "3000"))
+
+# Hard cap on chat-history tokens per prompt; oldest turns are dropped
+# first so a handful of very long messages can't bloat every call
+_HISTORY_TOKEN_BUDGET = int(os.getenv("HISTORY_TOKEN_BUDGET", "4000"))
+
+
+@lru_cache(maxsize=1)
+def _context_encoding():
+    """Tokenizer used for the context budget, loaded once per process"""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model("gpt-4")
+    except Exception:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+# Vietnamese-specific characters; compiled into a regex for the live
+# path (re.search scans in C and stops at the first hit) and into a
+# sorted codepoint array for the batch path below
+_VN_CHARS = ("ăâđêôơưàáảãạằắẳẵặầấẩẫậèéẻẽẹềếểễệìíỉĩịòóỏõọồốổỗộờớởỡợ"
+             "ùúủũụừứửữựỳýỷỹỵ")
+_VN_RE = re.compile("[" + _VN_CHARS + "]", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
+def _vn_codepoints():
+    """Sorted uint32 array of Vietnamese codepoints (both cases)"""
+    import numpy as np
+    chars = _VN_CHARS + _VN_CHARS.upper()
+    return np.sort(np.fromiter((ord(c) for c in chars), dtype=np.uint32))
+
+
+def detect_languages_batch(texts: List[str]) -> List[str]:
+    """Detect Vietnamese vs English for a batch of texts
+
+    Offline/evaluation counterpart to detect_language: each non-ASCII
+    text is decoded once to a uint32 codepoint array and checked against
+    the sorted Vietnamese codepoint table with np.searchsorted, keeping
+    the per-character work in C instead of a Python loop.
+
+    Args:
+        texts: Input texts
+
+    Returns:
+        List of 'vietnamese' or 'english', one per input text
+    """
+    import numpy as np
+
+    codepoints = _vn_codepoints()
+    results = []
+    for text in texts:
+        if text.isascii():
+            results.append("english")
+            continue
+        arr = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        idx = np.minimum(np.searchsorted(codepoints, arr),
+                         len(codepoints) - 1)
+        has_vn = bool(np.any(codepoints[idx] == arr))
+        results.append("vietnamese" if has_vn else "english")
+    return results
+
+
 class LLMChainManager:
     """Manages LLM chain with RAG and Function Calling"""
     
@@ -43,15 +152,22 @@ class LLMChainManager:
             azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
             api_key=os.getenv("AZURE_OPENAI_API_KEY"),
             temperature=float(os.getenv("TEMPERATURE", "0.7")),
-            max_tokens=int(os.getenv("MAX_TOKENS", "1000"))
+            max_tokens=int(os.getenv("MAX_TOKENS", "1000")),
+            # Bound request time and retries so a hung Azure call can't
+            # block the Streamlit worker indefinitely
+            timeout=float(os.getenv("AZURE_OPENAI_TIMEOUT", "20")),
+            max_retries=int(os.getenv("AZURE_OPENAI_MAX_RETRIES", "3"))
         )
         
         # LLM with function calling capability
         self.llm_with_functions = self.llm.bind(
-            functions=[GET_EXTERNAL_LINKS_SCHEMA]
+            functions=[GET_EXTERNAL_LINKS_SCHEMA, SEARCH_KB_SCHEMA]
         )
         
-        # System prompt
+        # System prompt. The static instructions come first and the
+        # per-turn {context} last: an identical prompt prefix across
+        # requests lets the Azure OpenAI server reuse its KV cache for
+        # the instruction block instead of re-processing it every call.
         self.system_prompt = """You are a helpful Vietnamese travel advisory chatbot. Your role is to:
 
 1. Provide accurate information about Vietnamese destinations, food, culture, and travel tips
@@ -60,22 +176,84 @@ class LLMChainManager:
 4. When recommending places or activities, use the get_external_links function to provide helpful links
 5. Be friendly, informative, and concise
 6. If you don't know something from the context, say so honestly
+7. After your answer, on a separate final line, write FOLLOWUPS: followed by a JSON array of 2-3 short follow-up questions in the user's language. Never mention this line in the answer itself.
 
-Context from knowledge base:
-{context}
+Remember: Match the user's language (Vietnamese or English) in your response.
 
-Remember: Match the user's language (Vietnamese or English) in your response."""
+Context from knowledge base:
+{context}"""
 
-        # Create prompt template
-        self.prompt = ChatPromptTemplate.from_messages([
-            ("system", self.system_prompt),
-            MessagesPlaceholder(variable_name="chat_history"),
-            ("human", "{question}")
-        ])
-        
         # Top-K for retrieval
         self.top_k = int(os.getenv("TOP_K_RETRIEVAL", "3"))
+
+        # Semantic cache: near-duplicate questions reuse the full cached
+        # response instead of paying for retrieval + completion again
+        self.semantic_cache = SemanticCache(
+            threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+        )
+
+        # Exact-text embedding memo: regenerations and repeated questions
+        # skip the Azure embeddings round-trip entirely
+        self._embed_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._embed_cache_size = 256
+
+        # Concurrent sessions embedding at the same moment share one
+        # batched embed_documents call instead of N serial round-trips
+        self._embed_batcher = EmbeddingBatcher(
+            self.vector_store_manager.embeddings
+        )
+
+        # Dedicated client for follow-up suggestions: deterministic and
+        # capped at 100 tokens, so calls are cheap and identical inputs
+        # yield identical (cacheable) outputs
+        self.followup_llm = AzureChatOpenAI(
+            azure_deployment=deployment_name,
+            model=deployment_name,
+            openai_api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
+            azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+            api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+            temperature=0,
+            max_tokens=100,
+            timeout=float(os.getenv("AZURE_OPENAI_TIMEOUT", "20")),
+            max_retries=int(os.getenv("AZURE_OPENAI_MAX_RETRIES", "3"))
+        )
+
+        # Memo for follow-up suggestions keyed by (question, answer,
+        # language) content hash; replayed turns skip the LLM call
+        self._followup_cache: "OrderedDict[bytes, List[str]]" = OrderedDict()
+        self._followup_cache_size = 512
+
+        # Dispatch table bound once: module-level tools plus the
+        # instance-bound knowledge-base search
+        self._dispatch = dict(AVAILABLE_FUNCTIONS)
+        self._dispatch[SEARCH_KB_SCHEMA["name"]] = self._search_knowledge_base
     
+    def _embed_query(self, question: str) -> List[float]:
+        """Embed a query, memoizing by normalized text
+
+        Identical questions (e.g. a regeneration, or the same example
+        button clicked twice) reuse the stored vector instead of paying
+        another embeddings API call. Near-duplicates still go through the
+        semantic cache downstream.
+
+        Args:
+            question: User's question
+
+        Returns:
+            Embedding vector for the question
+        """
+        key = " ".join(question.lower().split())
+        vector = self._embed_cache.get(key)
+        if vector is not None:
+            self._embed_cache.move_to_end(key)
+            return vector
+
+        vector = self._embed_batcher.embed(question)
+        self._embed_cache[key] = vector
+        if len(self._embed_cache) > self._embed_cache_size:
+            self._embed_cache.popitem(last=False)
+        return vector
+
     def format_docs(self, docs: List[Any]) -> str:
         """Format retrieved documents into context string
         
@@ -87,17 +265,23 @@ Remember: Match the user's language (Vietnamese or English) in your response."""
         """
         if not docs:
             return "No relevant information found in knowledge base."
-        
-        context_parts = []
-        for i, doc in enumerate(docs, 1):
-            content = doc.page_content
-            metadata = doc.metadata
-            lang = metadata.get("language", "unknown")
-            category = metadata.get("category", "general")
-            
-            context_parts.append(f"[Source {i} - {category} ({lang})]\n{content}\n")
-        
-        return "\n".join(context_parts)
+
+        context = "\n".join(
+            f"[Source {i} - {m.get('category', 'general')} "
+            f"({m.get('language', 'unknown')})]\n{doc.page_content}\n"
+            for i, doc in enumerate(docs, 1)
+            for m in (doc.metadata,)
+        )
+
+        # Token-aware cap: oversized contexts are truncated mid-doc
+        # instead of bloating the prompt (and the bill) unchecked
+        encoding = _context_encoding()
+        if encoding is not None:
+            tokens = encoding.encode(context)
+            if len(tokens) > _CONTEXT_TOKEN_BUDGET:
+                context = encoding.decode(tokens[:_CONTEXT_TOKEN_BUDGET])
+
+        return context
     
     def detect_language(self, text: str) -> str:
         """Detect if text is Vietnamese or English
@@ -108,55 +292,166 @@ Remember: Match the user's language (Vietnamese or English) in your response."""
         Returns:
             'vietnamese' or 'english'
         """
-        # Simple heuristic: check for Vietnamese characters
-        vietnamese_chars = ['ă', 'â', 'đ', 'ê', 'ô', 'ơ', 'ư', 'à', 'á', 'ả', 'ã', 'ạ',
-                           'ằ', 'ắ', 'ẳ', 'ẵ', 'ặ', 'ầ', 'ấ', 'ẩ', 'ẫ', 'ậ',
-                           'è', 'é', 'ẻ', 'ẽ', 'ẹ', 'ề', 'ế', 'ể', 'ễ', 'ệ',
-                           'ì', 'í', 'ỉ', 'ĩ', 'ị', 'ò', 'ó', 'ỏ', 'õ', 'ọ',
-                           'ồ', 'ố', 'ổ', 'ỗ', 'ộ', 'ờ', 'ớ', 'ở', 'ỡ', 'ợ',
-                           'ù', 'ú', 'ủ', 'ũ', 'ụ', 'ừ', 'ứ', 'ử', 'ữ', 'ự',
-                           'ỳ', 'ý', 'ỷ', 'ỹ', 'ỵ']
-        
-        text_lower = text.lower()
-        has_vietnamese = any(char in text_lower for char in vietnamese_chars)
-        
-        return "vietnamese" if has_vietnamese else "english"
+        # Simple heuristic: check for Vietnamese characters. ASCII-only
+        # text (the common English case) is settled by one C-level
+        # isascii() check; otherwise a single compiled-regex scan decides.
+        if text.isascii():
+            return "english"
+        return "vietnamese" if _VN_RE.search(text) else "english"
     
-    def run_chain(self, question: str, chat_history: List[Any]) -> Dict[str, Any]:
-        """Run the RAG chain with optional function calling
-        
+    def _split_followups(self, text: str):
+        """Split a raw completion into answer text and follow-up questions
+
+        Args:
+            text: Raw completion possibly ending in a FOLLOWUPS: line
+
+        Returns:
+            Tuple of (answer, followups) where followups is a list of
+            questions, or None when no parseable FOLLOWUPS line was found
+        """
+        idx = text.rfind(FOLLOWUP_MARKER)
+        if idx == -1:
+            return text.strip(), None
+
+        answer = text[:idx].rstrip()
+        tail = text[idx + len(FOLLOWUP_MARKER):]
+
+        start = tail.find('[')
+        end = tail.rfind(']')
+        if start != -1 and end > start:
+            try:
+                questions = json.loads(tail[start:end + 1])
+                questions = [str(q).strip() for q in questions if str(q).strip()]
+                if questions:
+                    return answer, questions[:3]
+            except (ValueError, TypeError):
+                pass
+
+        return answer, None
+
+    def _search_knowledge_base(self, query: str = "") -> str:
+        """Run a vector search on behalf of the model
+
+        Backs the search_knowledge_base tool: when the router classified
+        a turn as small talk but the model decides it needs facts after
+        all, it can fetch them here instead of hallucinating.
+
+        Args:
+            query: Search query chosen by the model
+
+        Returns:
+            Formatted context string from the retrieved documents
+        """
+        vector = self._embed_query(query)
+        docs = self.vector_store_manager.get_vectorstore() \
+            .similarity_search_by_vector(vector, k=self.top_k)
+        return self.format_docs(docs)
+
+    def _execute_function(self, function_name: str,
+                          function_args: Dict[str, Any]) -> str:
+        """Dispatch a model-requested function call
+
+        Args:
+            function_name: Name emitted by the model
+            function_args: Parsed arguments
+
+        Returns:
+            Function result string
+        """
+        return self._dispatch[function_name](**function_args)
+
+    def _is_known_function(self, function_name: str) -> bool:
+        """Whether a model-emitted function name can be executed"""
+        return function_name in self._dispatch
+
+    def _format_history(self, chat_history: List[Any]) -> List[Any]:
+        """Convert role/content dicts into LangChain message objects
+
         Args:
-            question: User's question
             chat_history: List of previous messages
-            
+
         Returns:
-            Dictionary with answer and metadata
+            List of HumanMessage/AIMessage objects
         """
-        # Detect language
-        language = self.detect_language(question)
-        
-        # Get retriever (could filter by language if needed)
-        retriever = self.vector_store_manager.get_retriever(k=self.top_k)
-        
-        # Retrieve relevant documents (use invoke instead of deprecated get_relevant_documents)
-        retrieved_docs = retriever.invoke(question)
-        context = self.format_docs(retrieved_docs)
-        
-        # Format chat history
         formatted_history = []
         for msg in chat_history:
             if msg["role"] == "user":
                 formatted_history.append(HumanMessage(content=msg["content"]))
             elif msg["role"] == "assistant":
                 formatted_history.append(AIMessage(content=msg["content"]))
-        
-        # Create messages
-        messages = [
-            SystemMessage(content=self.system_prompt.format(context=context))
-        ] + formatted_history + [
+
+        # Token cap, newest first: the turn count is already bounded
+        # upstream, but a few very long answers could still blow up the
+        # prompt. Oldest turns fall off first.
+        encoding = _context_encoding()
+        budget = _HISTORY_TOKEN_BUDGET
+        kept = 0
+        for message in reversed(formatted_history):
+            if encoding is not None:
+                budget -= len(encoding.encode(message.content))
+            else:
+                budget -= len(message.content) // 4
+            if budget < 0:
+                break
+            kept += 1
+        if kept < len(formatted_history):
+            formatted_history = formatted_history[len(formatted_history) - kept:]
+        return formatted_history
+
+    def _build_messages(self, question: str, chat_history: List[Any],
+                        context: str) -> List[Any]:
+        """Build the message list for an LLM call
+
+        Args:
+            question: User's question
+            chat_history: List of previous messages
+            context: Formatted context from the knowledge base
+
+        Returns:
+            List of LangChain message objects
+        """
+        return [
+            SystemMessage(content=self.system_prompt.format_map({"context": context}))
+        ] + self._format_history(chat_history) + [
             HumanMessage(content=question)
         ]
-        
+
+    def run_chain(self, question: str, chat_history: List[Any]) -> Dict[str, Any]:
+        """Run the RAG chain with optional function calling
+
+        Args:
+            question: User's question
+            chat_history: List of previous messages
+
+        Returns:
+            Dictionary with answer and metadata
+        """
+        # Detect language
+        language = self.detect_language(question)
+
+        # Small talk skips the embedding + Pinecone round-trip entirely
+        query_vector = None
+        retrieved_docs = []
+        if needs_retrieval(question):
+            # Embed the query once: it serves both the semantic-cache
+            # lookup and the vector search
+            query_vector = self._embed_query(question)
+
+            cached = self.semantic_cache.get(query_vector)
+            if cached is not None:
+                return dict(cached)
+
+            # Retrieve relevant documents with the precomputed embedding
+            retrieved_docs = self.vector_store_manager.get_vectorstore() \
+                .similarity_search_by_vector(query_vector, k=self.top_k)
+            context = self.format_docs(retrieved_docs)
+        else:
+            context = ("No retrieval was performed (casual conversation). "
+                       "Call search_knowledge_base if you need facts.")
+
+        # Create messages
+        messages = self._build_messages(question, chat_history, context)
+
         # First LLM call (may return function call)
         response = self.llm_with_functions.invoke(messages)
         
@@ -164,11 +459,11 @@ Remember: Match the user's language (Vietnamese or English) in your response."""
         if hasattr(response, 'additional_kwargs') and 'function_call' in response.additional_kwargs:
             function_call = response.additional_kwargs['function_call']
             function_name = function_call['name']
-            function_args = json.loads(function_call['arguments'])
+            function_args = _loads_args(function_call['arguments'])
             
             # Execute function
-            if function_name in AVAILABLE_FUNCTIONS:
-                function_result = AVAILABLE_FUNCTIONS[function_name](**function_args)
+            if self._is_known_function(function_name):
+                function_result = self._execute_function(function_name, function_args)
                 
                 # Add function result to messages and call LLM again
                 messages.append(AIMessage(
@@ -181,27 +476,274 @@ Remember: Match the user's language (Vietnamese or English) in your response."""
                 
                 # Second LLM call with function result
                 final_response = self.llm.invoke(messages)
-                answer = final_response.content
-                
-                return {
+                answer, followups = self._split_followups(final_response.content)
+
+                result = {
                     "answer": answer,
                     "language": language,
+                    "followup_questions": followups,
                     "function_called": function_name,
                     "function_args": function_args,
                     "function_result": function_result,
                     "sources": retrieved_docs
                 }
-        
+                if query_vector is not None:
+                    self.semantic_cache.set(query_vector, result)
+                return dict(result)
+
         # No function call needed
-        answer = response.content
-        
-        return {
+        answer, followups = self._split_followups(response.content)
+
+        result = {
             "answer": answer,
             "language": language,
+            "followup_questions": followups,
             "function_called": None,
             "sources": retrieved_docs
         }
-    
+        if query_vector is not None:
+            self.semantic_cache.set(query_vector, result)
+        return dict(result)
+
+    async def arun_chain(self, question: str,
+                         chat_history: List[Any]) -> Dict[str, Any]:
+        """Async variant of run_chain that overlaps independent I/O
+
+        The embedding call and the chat-history conversion run
+        concurrently via asyncio.gather, and both LLM hops use ainvoke so
+        the event loop stays free while Azure responds. Callers without a
+        running loop can use asyncio.run(manager.arun_chain(...)).
+
+        Args:
+            question: User's question
+            chat_history: List of previous messages
+
+        Returns:
+            Dictionary with answer and metadata
+        """
+        # Detect language
+        language = self.detect_language(question)
+
+        # Small talk skips the embedding + Pinecone round-trip entirely
+        query_vector = None
+        retrieved_docs = []
+        if needs_retrieval(question):
+            # Overlap the embeddings round-trip with history formatting;
+            # both are independent of each other
+            query_vector, formatted_history = await asyncio.gather(
+                asyncio.to_thread(self._embed_query, question),
+                asyncio.to_thread(self._format_history, chat_history),
+            )
+
+            cached = self.semantic_cache.get(query_vector)
+            if cached is not None:
+                return dict(cached)
+
+            # Vector search is a blocking SDK call; keep it off the loop
+            retrieved_docs = await asyncio.to_thread(
+                self.vector_store_manager.get_vectorstore().similarity_search_by_vector,
+                query_vector, k=self.top_k
+            )
+            context = self.format_docs(retrieved_docs)
+        else:
+            formatted_history = self._format_history(chat_history)
+            context = ("No retrieval was performed (casual conversation). "
+                       "Call search_knowledge_base if you need facts.")
+
+        messages = [
+            SystemMessage(content=self.system_prompt.format_map({"context": context}))
+        ] + formatted_history + [
+            HumanMessage(content=question)
+        ]
+
+        # First LLM call (may return function call)
+        response = await self.llm_with_functions.ainvoke(messages)
+
+        # Check if function calling is needed
+        if hasattr(response, 'additional_kwargs') and 'function_call' in response.additional_kwargs:
+            function_call = response.additional_kwargs['function_call']
+            function_name = function_call['name']
+            function_args = _loads_args(function_call['arguments'])
+
+            # Execute function off-loop: tools may block on file or
+            # network I/O (KB search embeds + queries Pinecone)
+            if self._is_known_function(function_name):
+                function_result = await asyncio.to_thread(
+                    self._execute_function, function_name, function_args
+                )
+
+                # Add function result to messages and call LLM again
+                messages.append(AIMessage(
+                    content="",
+                    additional_kwargs={'function_call': function_call}
+                ))
+                messages.append(HumanMessage(
+                    content=f"Function result: {function_result}"
+                ))
+
+                # Second LLM call with function result
+                final_response = await self.llm.ainvoke(messages)
+                answer, followups = self._split_followups(final_response.content)
+
+                result = {
+                    "answer": answer,
+                    "language": language,
+                    "followup_questions": followups,
+                    "function_called": function_name,
+                    "function_args": function_args,
+                    "function_result": function_result,
+                    "sources": retrieved_docs
+                }
+                if query_vector is not None:
+                    self.semantic_cache.set(query_vector, result)
+                return dict(result)
+
+        # No function call needed
+        answer, followups = self._split_followups(response.content)
+
+        result = {
+            "answer": answer,
+            "language": language,
+            "followup_questions": followups,
+            "function_called": None,
+            "sources": retrieved_docs
+        }
+        if query_vector is not None:
+            self.semantic_cache.set(query_vector, result)
+        return dict(result)
+
+    def run_chain_stream(self, question: str, chat_history: List[Any],
+                         meta: Optional[Dict[str, Any]] = None):
+        """Run the RAG chain and stream the answer token by token
+
+        Yields answer chunks as they arrive from Azure OpenAI so the UI can
+        render incrementally instead of blocking on the full completion.
+        Falls back to the non-streaming path when function calling is
+        triggered (the function result requires a second LLM call anyway).
+
+        Args:
+            question: User's question
+            chat_history: List of previous messages
+            meta: Optional dict filled in-place with answer metadata
+                  (language, function_called, function_result, sources)
+
+        Yields:
+            Answer text chunks
+        """
+        if meta is None:
+            meta = {}
+
+        # Detect language
+        language = self.detect_language(question)
+        meta["language"] = language
+        meta["function_called"] = None
+
+        # Small talk skips the embedding + Pinecone round-trip entirely
+        query_vector = None
+        retrieved_docs = []
+        if needs_retrieval(question):
+            # Embed once for cache lookup + vector search
+            query_vector = self._embed_query(question)
+
+            cached = self.semantic_cache.get(query_vector)
+            if cached is not None:
+                meta.update(cached)
+                yield cached["answer"]
+                return
+
+            # Retrieve relevant documents with the precomputed embedding
+            retrieved_docs = self.vector_store_manager.get_vectorstore() \
+                .similarity_search_by_vector(query_vector, k=self.top_k)
+            context = self.format_docs(retrieved_docs)
+        else:
+            context = ("No retrieval was performed (casual conversation). "
+                       "Call search_knowledge_base if you need facts.")
+        meta["sources"] = retrieved_docs
+
+        # Create messages
+        messages = self._build_messages(question, chat_history, context)
+
+        # Stream the first LLM call, accumulating any function-call deltas.
+        # The trailing FOLLOWUPS: line is withheld from yielded deltas: we
+        # only emit text that can no longer be part of the marker.
+        function_name = ""
+        function_args_str = ""
+        buffer = ""
+        emitted = 0
+        suppress = False
+        for chunk in self.llm_with_functions.stream(messages):
+            function_call = (chunk.additional_kwargs or {}).get("function_call")
+            if function_call:
+                function_name += function_call.get("name") or ""
+                function_args_str += function_call.get("arguments") or ""
+                continue
+            if chunk.content and not suppress:
+                buffer += chunk.content
+                idx = buffer.find(FOLLOWUP_MARKER, max(0, emitted - len(FOLLOWUP_MARKER)))
+                if idx != -1:
+                    if idx > emitted:
+                        yield buffer[emitted:idx].rstrip()
+                    emitted = idx
+                    suppress = True
+                else:
+                    safe = len(buffer) - len(FOLLOWUP_MARKER)
+                    if safe > emitted:
+                        yield buffer[emitted:safe]
+                        emitted = safe
+            elif chunk.content:
+                buffer += chunk.content
+
+        # Function calling triggered: execute and fall back to a blocking call
+        if function_name and self._is_known_function(function_name):
+            function_args = _loads_args(function_args_str)
+            function_result = self._execute_function(function_name, function_args)
+
+            # Add function result to messages and call LLM again
+            messages.append(AIMessage(
+                content="",
+                additional_kwargs={'function_call': {
+                    'name': function_name,
+                    'arguments': function_args_str
+                }}
+            ))
+            messages.append(HumanMessage(
+                content=f"Function result: {function_result}"
+            ))
+
+            final_response = self.llm.invoke(messages)
+
+            meta["function_called"] = function_name
+            meta["function_args"] = function_args
+            meta["function_result"] = function_result
+
+            answer, followups = self._split_followups(final_response.content)
+            meta["answer"] = answer
+            meta["followup_questions"] = followups
+            self._cache_stream_result(query_vector, meta)
+
+            yield answer
+            return
+
+        # Flush any withheld tail and record parsed answer + followups
+        answer, followups = self._split_followups(buffer)
+        meta["answer"] = answer
+        meta["followup_questions"] = followups
+        self._cache_stream_result(query_vector, meta)
+        if not suppress and len(answer) > emitted:
+            yield answer[emitted:]
+
+    def _cache_stream_result(self, query_vector, meta: Dict[str, Any]):
+        """Snapshot a finished streaming turn into the semantic cache"""
+        if query_vector is None:
+            return
+        self.semantic_cache.set(query_vector, {
+            key: meta[key] for key in (
+                "answer", "language", "followup_questions",
+                "function_called", "function_args", "function_result",
+                "sources"
+            ) if key in meta
+        })
+
     def generate_followup_questions(self, question: str, answer: str, 
                                     language: str) -> List[str]:
         """Generate follow-up question suggestions
@@ -214,6 +756,17 @@ Remember: Match the user's language (Vietnamese or English) in your response."""
         Returns:
             List of 2-3 follow-up questions
         """
+        # Replays and semantic-cache misses with identical turns hit the
+        # memo; the digest keeps keys small for long answers
+        cache_key = hashlib.blake2b(
+            f"{language}:{question}\n{answer}".encode("utf-8"),
+            digest_size=16
+        ).digest()
+        cached = self._followup_cache.get(cache_key)
+        if cached is not None:
+            self._followup_cache.move_to_end(cache_key)
+            return list(cached)
+
         if language == "vietnamese":
             prompt = f"""Dựa trên câu hỏi và câu trả lời dưới đây, hãy đề xuất 2-3 câu hỏi tiếp theo mà người dùng có thể quan tâm.
 
@@ -230,11 +783,16 @@ Answer: {answer}
 Return ONLY a list of questions, one per line, without additional explanation."""
         
         try:
-            response = self.llm.invoke([HumanMessage(content=prompt)])
+            response = self.followup_llm.invoke([HumanMessage(content=prompt)])
             questions = [q.strip() for q in response.content.split('\n') if q.strip()]
             # Remove numbering if present
             questions = [q.lstrip('0123456789.-) ') for q in questions]
-            return questions[:3]  # Limit to 3
+            questions = questions[:3]  # Limit to 3
+
+            self._followup_cache[cache_key] = questions
+            if len(self._followup_cache) > self._followup_cache_size:
+                self._followup_cache.popitem(last=False)
+            return list(questions)
         except Exception as e:
             print(f"Error generating follow-up questions: {e}")
             # Default fallback questions
@@ -0,0 +1,81 @@
+"""Cached Component Singletons for the Streamlit App
+
+Each manager gets its own @st.cache_resource getter so components are
+constructed once per process and shared across sessions, and call sites
+can fetch exactly the component they need without tuple unpacking or
+per-rerun session-state writes.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+
+@st.cache_resource
+def _load_env() -> bool:
+    """Load configuration once per process
+
+    Merges st.secrets (Streamlit's TOML store, parsed once at startup —
+    the deployment-time config channel on Streamlit Cloud) into
+    os.environ first, then applies the local .env file. Existing
+    environment variables always win, so every downstream os.getenv
+    keeps working regardless of where a value came from.
+    """
+    import os
+
+    try:
+        for key, value in st.secrets.items():
+            if isinstance(value, str) and key not in os.environ:
+                os.environ[key] = value
+    except Exception:
+        # No secrets.toml configured - fine for local dev
+        pass
+
+    from src.utils import load_env_file
+    return load_env_file()
+
+
+@st.cache_resource
+def get_vs_manager():
+    """Get the shared VectorStoreManager instance"""
+    from src.vector_store import VectorStoreManager
+    _load_env()
+    return VectorStoreManager(verbose=False)
+
+
+@st.cache_resource
+def get_llm_manager():
+    """Get the shared LLMChainManager instance"""
+    from src.llm_chain import LLMChainManager
+    _load_env()
+    return LLMChainManager(get_vs_manager(), verbose=False)
+
+
+@st.cache_resource
+def get_tts_manager():
+    """Get the shared TTSManager instance"""
+    from src.tts import TTSManager
+    return TTSManager()
+
+
+@st.cache_resource
+def get_chat_storage():
+    """Get the shared ChatStorageManager instance"""
+    from src.chat_storage import ChatStorageManager
+    return ChatStorageManager()
+
+
+@st.cache_resource
+def get_background_executor() -> ThreadPoolExecutor:
+    """Get the process-wide thread pool for TTS / LLM fan-out work"""
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="vtc")
+
+
+@st.cache_resource
+def get_save_executor() -> ThreadPoolExecutor:
+    """Get the executor for chat-session disk writes
+
+    A single worker guarantees writes apply in submission order, so the
+    append-only session logs can never interleave.
+    """
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="vtc-save")
@@ -0,0 +1,66 @@
+"""Lightweight Retrieval Router
+
+Decides whether a user message actually needs a knowledge-base lookup.
+Small talk ("hi", "thanks", "who are you?") otherwise pays for an
+embedding call plus a Pinecone query that contributes nothing to the
+answer.
+"""
+
+import re
+from functools import lru_cache
+
+from src.function_calls import load_mock_links
+
+
+# Travel-domain vocabulary that strongly suggests a knowledge-base query.
+# Compiled once at import; matching is case-insensitive.
+_TRAVEL_RE = re.compile(
+    r"vietnam|viet nam|hanoi|ha noi|saigon|sai gon|ho chi minh|hcmc"
+    r"|da nang|hue|hoi an|sapa|sa pa|ha long|halong|phu quoc|nha trang"
+    r"|mekong|ninh binh|mui ne|da lat|dalat"
+    r"|pho|banh|bun|spring roll|egg coffee|street food"
+    r"|travel|trip|visit|itinerary|destination|visa|hotel|hostel|flight"
+    r"|beach|temple|pagoda|museum|tour|weather|season|festival|market"
+    r"|du lịch|địa điểm|tham quan|khách sạn|chuyến|thời tiết|mùa"
+    r"|món ăn|đặc sản|ẩm thực|lễ hội|chợ|bãi biển|chùa|vé|ăn gì|ở đâu",
+    re.IGNORECASE
+)
+
+# Messages this short with no travel vocabulary are treated as small talk
+_SMALL_TALK_MAX_WORDS = 5
+
+
+@lru_cache(maxsize=1)
+def _catalog_keywords() -> frozenset:
+    """Collect normalized keywords from the mock-links catalog"""
+    keywords = set()
+    for key, value in load_mock_links().items():
+        keywords.add(key.replace("_", " "))
+        keywords.update(kw.lower().strip() for kw in value.get("keywords", []))
+    return frozenset(keywords)
+
+
+def needs_retrieval(question: str) -> bool:
+    """Decide whether a question warrants a knowledge-base lookup
+
+    Errs on the side of retrieving: anything long enough to be a real
+    question, or containing travel vocabulary, goes through RAG. Only
+    short messages with no domain signal skip it.
+
+    Args:
+        question: The user's message
+
+    Returns:
+        True if vector retrieval should run for this message
+    """
+    text = question.lower().strip()
+    if not text:
+        return False
+
+    if _TRAVEL_RE.search(text):
+        return True
+
+    if any(keyword in text for keyword in _catalog_keywords()):
+        return True
+
+    return len(text.split()) > _SMALL_TALK_MAX_WORDS
@@ -0,0 +1,113 @@
+"""In-Memory Semantic Cache for LLM Responses
+
+Near-duplicate questions ("what to eat in Hanoi?" / "best Hanoi food?")
+should not pay for a second retrieval + LLM round-trip. Queries are
+bucketed by a random-projection LSH signature of their embedding; within
+a bucket, cosine similarity decides whether a cached response is close
+enough to reuse.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+class SemanticCache:
+    """LSH-bucketed cache keyed by query embedding vectors"""
+
+    def __init__(self, n_projections: int = 16, threshold: float = 0.95,
+                 max_entries: int = 256, seed: int = 0):
+        """Initialize the cache
+
+        Args:
+            n_projections: Number of random hyperplanes in the LSH
+                signature; more projections mean smaller, more precise
+                buckets
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Cap on stored entries (oldest evicted first)
+            seed: RNG seed so signatures are stable within a process
+        """
+        self.n_projections = n_projections
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._rng = np.random.default_rng(seed)
+        # Hyperplanes are sized lazily once the embedding dim is known
+        self._planes: Optional[np.ndarray] = None
+        # entry_id -> (vector, norm, value, signature), insertion-ordered
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._buckets: Dict[bytes, List[int]] = {}
+        self._next_id = 0
+
+    def _signature(self, vec: np.ndarray) -> bytes:
+        """Compute the LSH bucket signature for a vector"""
+        if self._planes is None:
+            self._planes = self._rng.standard_normal(
+                (vec.shape[0], self.n_projections)
+            )
+        return np.packbits(vec @ self._planes > 0).tobytes()
+
+    def get(self, vector) -> Optional[Any]:
+        """Look up a cached value for a semantically similar query
+
+        Args:
+            vector: Query embedding (list or ndarray)
+
+        Returns:
+            The cached value whose vector is most similar to the query
+            (cosine >= threshold), or None on a miss
+        """
+        if not self._entries:
+            return None
+
+        vec = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(vec))
+        if norm == 0.0:
+            return None
+
+        candidates = self._buckets.get(self._signature(vec))
+        if not candidates:
+            return None
+
+        best = None
+        best_sim = self.threshold
+        for entry_id in candidates:
+            entry = self._entries.get(entry_id)
+            if entry is None:
+                continue
+            cvec, cnorm, value, _ = entry
+            sim = float(vec @ cvec) / (norm * cnorm)
+            if sim >= best_sim:
+                best_sim = sim
+                best = value
+        return best
+
+    def set(self, vector, value: Any):
+        """Store a value under a query embedding
+
+        Args:
+            vector: Query embedding (list or ndarray)
+            value: Value to cache
+        """
+        vec = np.asarray(vector, dtype=np.float32)
+        cnorm = float(np.linalg.norm(vec))
+        if cnorm == 0.0:
+            return
+
+        sig = self._signature(vec)
+        entry_id = self._next_id
+        self._next_id += 1
+
+        self._entries[entry_id] = (vec, cnorm, value, sig)
+        self._buckets.setdefault(sig, []).append(entry_id)
+
+        if len(self._entries) > self.max_entries:
+            old_id, (_, _, _, old_sig) = self._entries.popitem(last=False)
+            bucket = self._buckets.get(old_sig)
+            if bucket is not None:
+                bucket.remove(old_id)
+                if not bucket:
+                    del self._buckets[old_sig]
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,57 +1,165 @@
 """Text-to-Speech using gTTS (Google Text-to-Speech) - Simple and Free"""
 
-from typing import Optional
+import hashlib
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterator, Optional
 from gtts import gTTS
 import io
 
 
+# Sentence boundary splitter (handles Latin and CJK punctuation)
+_SENTENCE_RE = re.compile(r'(?<=[.!?。?!])\s+')
+
+
 class TTSManager:
-    """Manages Text-to-Speech conversion using gTTS (Google)"""
-    
-    def __init__(self):
-        """Initialize TTS manager"""
+    """Manages Text-to-Speech conversion using gTTS (Google)
+
+    Synthesized audio is cached by (text, language) hash — in memory for
+    the hot path and on disk so replays survive process restarts — since
+    identical assistant messages are frequently replayed.
+    """
+
+    def __init__(self, cache_dir: str = "chat_history/.tts_cache",
+                 mem_cache_size: int = 128):
+        """Initialize TTS manager
+
+        Args:
+            cache_dir: Directory for the on-disk audio cache
+            mem_cache_size: Entries kept in the in-memory LRU
+        """
         print("[TTS] gTTS (Google Text-to-Speech) initialized - No API key needed!")
-        
+
         # Language mapping
         self.language_codes = {
             "vietnamese": "vi",
             "english": "en"
         }
-    
+
+        self._mem_cache: OrderedDict = OrderedDict()
+        self._mem_cache_size = mem_cache_size
+        self._cache_dir = Path(cache_dir)
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"[TTS] Disk cache disabled: {e}")
+            self._cache_dir = None
+
+    def _cache_key(self, text: str, language: str) -> str:
+        """Hash a (text, language) pair into a cache key"""
+        return hashlib.sha1(f"{language}:{text}".encode("utf-8")).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[bytes]:
+        """Look up cached audio, promoting disk hits into memory"""
+        audio = self._mem_cache.get(key)
+        if audio is not None:
+            self._mem_cache.move_to_end(key)
+            return audio
+
+        if self._cache_dir is not None:
+            path = self._cache_dir / f"{key}.mp3"
+            if path.exists():
+                try:
+                    audio = path.read_bytes()
+                    self._mem_put(key, audio)
+                    return audio
+                except OSError:
+                    pass
+        return None
+
+    def _mem_put(self, key: str, audio: bytes):
+        self._mem_cache[key] = audio
+        self._mem_cache.move_to_end(key)
+        if len(self._mem_cache) > self._mem_cache_size:
+            self._mem_cache.popitem(last=False)
+
+    def _cache_put(self, key: str, audio: bytes):
+        """Store audio in both cache tiers"""
+        self._mem_put(key, audio)
+        if self._cache_dir is not None:
+            try:
+                (self._cache_dir / f"{key}.mp3").write_bytes(audio)
+            except OSError as e:
+                print(f"[TTS] Disk cache write failed: {e}")
+
     def text_to_speech(self, text: str, language: str = "english") -> Optional[bytes]:
         """Convert text to speech using Google TTS
-        
+
         Args:
             text: Text to convert
             language: 'vietnamese' or 'english'
-            
+
         Returns:
             Audio bytes or None if failed
         """
         if language not in self.language_codes:
             print(f"Unsupported language: {language}")
             return None
-        
+
         lang_code = self.language_codes[language]
-        
+
+        # Limit text length
+        text = text[:500]
+
+        key = self._cache_key(text, language)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         try:
-            # Limit text length
-            text = text[:500]
-            
             # Create gTTS object
             tts = gTTS(text=text, lang=lang_code, slow=False)
-            
+
             # Save to bytes buffer
             audio_buffer = io.BytesIO()
             tts.write_to_fp(audio_buffer)
             audio_buffer.seek(0)
-            
-            return audio_buffer.read()
-            
+
+            audio = audio_buffer.read()
+            self._cache_put(key, audio)
+            return audio
+
         except Exception as e:
             print(f"TTS error: {str(e)}")
             return None
     
+    def stream_sentences(self, text: str, language: str = "english") -> Iterator[bytes]:
+        """Convert text to speech one sentence chunk at a time
+
+        Yields an MP3 blob per sentence so playback can begin after the
+        first sentence instead of waiting for the whole message.
+
+        Args:
+            text: Text to convert
+            language: 'vietnamese' or 'english'
+
+        Yields:
+            MP3 audio bytes per sentence chunk
+        """
+        if language not in self.language_codes:
+            print(f"Unsupported language: {language}")
+            return
+
+        lang_code = self.language_codes[language]
+
+        for sentence in _SENTENCE_RE.split(text):
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+
+            try:
+                tts = gTTS(text=sentence[:500], lang=lang_code, slow=False)
+
+                audio_buffer = io.BytesIO()
+                tts.write_to_fp(audio_buffer)
+                audio_buffer.seek(0)
+
+                yield audio_buffer.read()
+            except Exception as e:
+                print(f"TTS error on sentence chunk: {str(e)}")
+                return
+
     def is_available(self) -> bool:
         """Check if TTS is available
         
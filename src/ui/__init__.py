@@ -6,28 +6,44 @@ This package contains all UI-related components including:
 - Message display
 - Welcome screen
 - Session management
+
+Submodules are imported lazily (PEP 562): each re-exported symbol pulls
+in its module on first access only, so importing src.ui costs nothing
+up front and Streamlit's auto-reload cycles don't re-pay for modules
+the current page never touches.
 """
 
-from .styles import load_custom_css
-from .sidebar import display_sidebar
-from .messages import display_message, display_followup_questions
-from .welcome import display_welcome_screen
-from .session_manager import (
-    create_new_chat,
-    load_chat_session,
-    delete_chat_session,
-    save_current_chat
-)
-
-__all__ = [
-    'load_custom_css',
-    'display_sidebar',
-    'display_message',
-    'display_followup_questions',
-    'display_welcome_screen',
-    'create_new_chat',
-    'load_chat_session',
-    'delete_chat_session',
-    'save_current_chat'
-]
+import importlib
+
+# Which submodule provides each re-exported symbol
+_LAZY = {
+    'load_custom_css': '.styles',
+    'display_sidebar': '.sidebar',
+    'display_message': '.messages',
+    'display_followup_questions': '.messages',
+    'display_welcome_screen': '.welcome',
+    'create_new_chat': '.session_manager',
+    'load_chat_session': '.session_manager',
+    'delete_chat_session': '.session_manager',
+    'save_current_chat': '.session_manager',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    """Resolve a re-exported symbol on first access and cache it"""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,57 @@
+"""UI Language String Tables
+
+One module-level dict per UI language; render functions do a single
+``I18N[ui_lang]`` lookup instead of evaluating ``"..." if ui_lang == "en"
+else "..."`` ternaries throughout the hot render paths.
+"""
+
+I18N = {
+    "en": {
+        "new_chat": "➕ New Chat",
+        "chat_history_header": "💬 Chat History",
+        "no_history": "No chat history yet",
+        "settings": "⚙️ Settings",
+        "interface_language": "Interface Language",
+        "welcome_title": "🇻🇳 Welcome to Vietnam Travel Chatbot",
+        "welcome_subtitle": "Your AI-powered Vietnamese travel assistant",
+        "sidebar_title": "Vietnam Travel",
+        "sidebar_subtitle": "Your AI Travel Assistant",
+        "thinking": "Thinking...",
+        "external_links": "🔗 External Links Retrieved",
+        "placeholder": "Type your question here...",
+        "show_earlier": "Show earlier messages ({n})",
+        "manage_chats": "🗑️ Manage chats",
+        "select_chats": "Select chats to delete",
+        "delete_selected": "Delete selected",
+    },
+    "vi": {
+        "new_chat": "➕ Trò chuyện mới",
+        "chat_history_header": "💬 Lịch sử trò chuyện",
+        "no_history": "Chưa có lịch sử",
+        "settings": "⚙️ Cài đặt",
+        "interface_language": "Ngôn ngữ giao diện",
+        "welcome_title": "🇻🇳 Chào mừng đến với Vietnam Travel Chatbot",
+        "welcome_subtitle": "Trợ lý du lịch Việt Nam được hỗ trợ bởi AI",
+        "sidebar_title": "Du Lịch Việt Nam",
+        "sidebar_subtitle": "Trợ Lý Du Lịch AI",
+        "thinking": "Đang suy nghĩ...",
+        "external_links": "🔗 Liên kết bên ngoài",
+        "placeholder": "Nhập câu hỏi của bạn...",
+        "show_earlier": "Xem tin nhắn trước ({n})",
+        "manage_chats": "🗑️ Quản lý trò chuyện",
+        "select_chats": "Chọn trò chuyện để xoá",
+        "delete_selected": "Xoá mục đã chọn",
+    },
+}
+
+
+def get_strings(ui_lang: str) -> dict:
+    """Get the string table for a UI language, defaulting to English
+
+    Args:
+        ui_lang: Current UI language ('en' or 'vi')
+
+    Returns:
+        Dictionary of UI strings
+    """
+    return I18N.get(ui_lang, I18N["en"])
@@ -2,11 +2,25 @@
 
 import streamlit as st
 
+from src.resources import get_tts_manager
 
-def display_message(role: str, content: str, show_tts: bool = False, 
+
+# Static strings hoisted out of the per-rerun render path
+_FOLLOWUP_TITLES = {
+    "english": "❓ Suggested questions:",
+    "vietnamese": "❓ Câu hỏi gợi ý:",
+}
+
+
+@st.fragment
+def display_message(role: str, content: str, show_tts: bool = False,
                    language: str = "english", message_id: str = None):
     """Display a chat message with optional TTS using native Streamlit audio player
-    
+
+    Each message is its own fragment, so interacting with one message
+    (e.g. its TTS button) reruns only that message, not the whole
+    history loop.
+
     Args:
         role: 'user' or 'assistant'
         content: Message content
@@ -24,44 +38,92 @@ def display_message(role: str, content: str, show_tts: bool = False,
 
 def _display_tts_controls(content: str, language: str, message_id: str):
     """Display TTS control using native Streamlit audio player (no custom JS)
-    
+
+    Generated audio is stashed in session state and the player rendered
+    on every rerun it exists, so the widget survives reruns and a second
+    click (or an unrelated rerun) never re-synthesizes anything.
+
     Args:
         content: Message content to convert to speech
         language: Message language
         message_id: Unique message identifier
     """
+    audio_key = f"audio_bytes_{message_id}"
+    just_generated = False
+
     # Simple button to generate audio
     if st.button("🔊 Play Audio", key=f"tts_play_{message_id}", help="Listen to this message"):
         try:
-            tts_manager = st.session_state.tts_manager
-            audio_bytes = tts_manager.text_to_speech(content, language)
-            
-            if audio_bytes:
-                # Use native Streamlit audio player - no custom HTML/JS
-                st.audio(audio_bytes, format='audio/mp3')
+            # Prefer audio pre-synthesized in the background right after
+            # the answer arrived; fall back to on-demand synthesis.
+            # TTSManager caches by content hash internally, so replays
+            # and repeated answers never hit the network twice.
+            future = st.session_state.get("tts_futures", {}).get(message_id)
+            if future is not None:
+                if future.done():
+                    st.session_state[audio_key] = future.result()
+                else:
+                    # Prefetch still running: the wait is bounded and
+                    # scoped to this message's fragment, so the rest of
+                    # the app stays interactive meanwhile
+                    with st.spinner("Generating audio..."):
+                        st.session_state[audio_key] = future.result(timeout=10)
+                just_generated = True
+            elif len(content) > 200:
+                # Long message without prefetched audio: stream sentence
+                # chunks so playback can start after the first sentence,
+                # then persist them for later reruns
+                chunks = []
+                for chunk_bytes in get_tts_manager().stream_sentences(content, language):
+                    st.audio(chunk_bytes, format='audio/mp3', autoplay=not chunks)
+                    chunks.append(chunk_bytes)
+                st.session_state[audio_key] = chunks
+                if chunks:
+                    # Already rendered above with autoplay
+                    return
             else:
+                st.session_state[audio_key] = get_tts_manager().text_to_speech(
+                    content, language
+                )
+                just_generated = True
+
+            if not st.session_state.get(audio_key):
                 st.warning("Could not generate audio")
         except Exception as e:
             st.error(f"Audio generation failed: {str(e)}")
 
+    # Rendered outside the click branch so the player persists across
+    # reruns; autoplay only on the run that produced the audio
+    audio = st.session_state.get(audio_key)
+    if audio:
+        if isinstance(audio, list):
+            for chunk_bytes in audio:
+                st.audio(chunk_bytes, format='audio/mp3')
+        else:
+            st.audio(audio, format='audio/mp3', autoplay=just_generated)
+
 
-def display_followup_questions(questions: list, language: str):
+def display_followup_questions(questions: list, language: str, key_ns: str = "hist"):
     """Display follow-up question buttons
-    
+
     Args:
         questions: List of follow-up questions
         language: Current language
+        key_ns: Widget-key namespace, so the history pane and the live
+            answer fragment can both render suggestions in one run
     """
     if not questions:
         return
-    
-    title = "❓ Suggested questions:" if language == "english" else "❓ Câu hỏi gợi ý:"
+
+    title = _FOLLOWUP_TITLES.get(language, _FOLLOWUP_TITLES["english"])
     st.markdown(f"**{title}**")
-    
+
     cols = st.columns(len(questions))
     for i, (col, question) in enumerate(zip(cols, questions)):
         with col:
-            if st.button(question, key=f"followup_{i}", use_container_width=True):
+            if st.button(question, key=f"followup_{key_ns}_{i}", use_container_width=True):
                 st.session_state.current_input = question
-                st.rerun()
+                # Full-app rerun: input processing happens at top level,
+                # outside the history fragment
+                st.rerun(scope="app")
 
@@ -1,17 +1,46 @@
 """Session Management Functions"""
 
+import itertools
 import streamlit as st
 import uuid
+from collections import deque
 from datetime import datetime
 
+from src.conversation import MessageLog
+from src.resources import get_chat_storage, get_save_executor
+
+
+# Cap on messages kept in session state for a single chat
+MESSAGE_HISTORY_CAP = 200
+
+# How many recent sessions the sidebar lists
+RECENT_CHATS_CAP = 10
+
+
+def touch_recent_chat(session_id: str):
+    """Move a session to the front of the sidebar's recency order
+
+    The sidebar iterates this small bounded deque instead of slicing and
+    reversing the full chat_sessions dict on every rerun.
+
+    Args:
+        session_id: Unique session identifier
+    """
+    order = st.session_state.setdefault(
+        "chat_order", deque(maxlen=RECENT_CHATS_CAP)
+    )
+    if session_id in order:
+        order.remove(session_id)
+    order.appendleft(session_id)
+
 
 def create_new_chat():
     """Create a new chat session"""
     st.session_state.current_chat_id = str(uuid.uuid4())
     st.session_state.conversation_manager.clear_history()
-    st.session_state.messages = []
+    st.session_state.messages = MessageLog(maxlen=MESSAGE_HISTORY_CAP)
     st.session_state.followup_questions = []
-    st.rerun()
+    st.rerun(scope="app")
 
 
 def load_chat_session(session_id: str):
@@ -22,70 +51,126 @@ def load_chat_session(session_id: str):
     """
     if session_id in st.session_state.chat_sessions:
         session_data = st.session_state.chat_sessions[session_id]
+
+        # Sidebar index entries only hold preview/timestamp; fetch the
+        # full message list from disk just-in-time
+        if "messages" not in session_data:
+            full_data = get_chat_storage().load_session(session_id)
+            if full_data:
+                session_data = full_data
+
         st.session_state.current_chat_id = session_id
-        st.session_state.messages = session_data.get("messages", [])
+        touch_recent_chat(session_id)
+        st.session_state.messages = MessageLog.from_list(
+            session_data.get("messages", []), maxlen=MESSAGE_HISTORY_CAP
+        )
         st.session_state.followup_questions = session_data.get("followup_questions", [])
+
+        # Everything now in memory is already on disk
+        st.session_state.setdefault("saved_counts", {})[session_id] = \
+            len(st.session_state.messages)
+
+        # Restore conversation history in one bulk assignment
+        st.session_state.conversation_manager.load_history(st.session_state.messages)
         
-        # Restore conversation history
-        st.session_state.conversation_manager.clear_history()
-        for msg in st.session_state.messages:
-            st.session_state.conversation_manager.add_message(msg["role"], msg["content"])
-        
-        st.rerun()
+        st.rerun(scope="app")
 
 
 def delete_chat_session(session_id: str):
     """Delete a chat session
-    
+
     Args:
         session_id: Unique session identifier
     """
-    # Remove from session state
-    if session_id in st.session_state.chat_sessions:
-        del st.session_state.chat_sessions[session_id]
-    
-    # Delete from file system
-    if "chat_storage" in st.session_state:
-        st.session_state.chat_storage.delete_session(session_id)
-    
+    delete_chat_sessions([session_id])
+
+
+def delete_chat_sessions(session_ids: list):
+    """Delete several chat sessions with a single rerun at the end
+
+    Args:
+        session_ids: Session identifiers to delete
+    """
+    storage = get_chat_storage()
+    order = st.session_state.get("chat_order")
+    for session_id in session_ids:
+        # Remove from session state
+        st.session_state.chat_sessions.pop(session_id, None)
+        if order and session_id in order:
+            order.remove(session_id)
+
+        # Delete from file system
+        storage.delete_session(session_id)
+
     # If deleting current chat, create new one
-    if st.session_state.get("current_chat_id") == session_id:
+    if st.session_state.get("current_chat_id") in set(session_ids):
         create_new_chat()
     else:
-        st.rerun()
+        st.rerun(scope="app")
+
+
+def _append_messages(storage, session_id: str, msgs: list):
+    """Write a batch of messages to a session log (runs on the saver thread)"""
+    for msg in msgs:
+        storage.append_message(session_id, msg)
 
 
 def save_current_chat():
-    """Save current chat session to file system"""
-    if not st.session_state.messages:
+    """Persist the current chat session incrementally
+
+    Only the messages added since the last save are appended to the
+    session's JSONL log (O(1) I/O per turn); the preview/timestamp
+    metadata lives in a tiny side file rewritten each time. The disk
+    writes themselves run on a single-worker background executor, so the
+    user never waits on file I/O — session state is read on this thread
+    and only plain data crosses into the worker.
+    """
+    messages = st.session_state.messages
+    if not messages:
         return
-    
+
     current_id = st.session_state.get("current_chat_id")
     if not current_id:
         current_id = str(uuid.uuid4())
         st.session_state.current_chat_id = current_id
-    
+
+    storage = get_chat_storage()
+    saved_counts = st.session_state.setdefault("saved_counts", {})
+    saved = saved_counts.get(current_id, 0)
+
+    saver = get_save_executor()
+    if saved < len(messages) and len(messages) < messages.maxlen:
+        # Normal case: append just the unsaved tail
+        new_msgs = list(itertools.islice(messages, saved, None))
+        saver.submit(_append_messages, storage, current_id, new_msgs)
+    elif saved != len(messages) or len(messages) >= messages.maxlen:
+        # The bounded deque started evicting (or history was replaced),
+        # so the log tail no longer lines up — rewrite it once
+        saver.submit(storage.write_log, current_id, list(messages))
+    saved_counts[current_id] = len(messages)
+
     # Get preview from first user message
     preview = "New conversation"
-    for msg in st.session_state.messages:
+    for msg in messages:
         if msg["role"] == "user":
             preview = msg["content"]
             break
-    
-    # Prepare session data
-    session_data = {
-        "messages": st.session_state.messages.copy(),
-        "followup_questions": st.session_state.followup_questions.copy(),
+
+    # Safe to share the list with the saver thread: follow-up suggestions
+    # are only ever reassigned wholesale, never mutated in place
+    meta = {
         "preview": preview,
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M")
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "followup_questions": st.session_state.followup_questions
     }
-    
-    # Save to file system
-    if "chat_storage" in st.session_state:
-        st.session_state.chat_storage.save_session(current_id, session_data)
-    
-    # Also keep in session state for quick access
+    saver.submit(storage.update_meta, current_id, meta)
+
+    # Keep the sidebar index entry fresh
     if "chat_sessions" not in st.session_state:
         st.session_state.chat_sessions = {}
-    st.session_state.chat_sessions[current_id] = session_data
+    st.session_state.chat_sessions[current_id] = {
+        "preview": preview,
+        "timestamp": meta["timestamp"]
+    }
+    touch_recent_chat(current_id)
 
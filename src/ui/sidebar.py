@@ -1,21 +1,32 @@
 """Sidebar Display Components"""
 
+import html
+from functools import lru_cache
+
 import streamlit as st
-from .session_manager import create_new_chat, load_chat_session, delete_chat_session
+
+from src.utils import truncate_text
+from .i18n import get_strings
+from .session_manager import (
+    create_new_chat,
+    load_chat_session,
+    delete_chat_sessions
+)
 
 
 def display_sidebar():
     """Display sidebar with native Streamlit components - no custom HTML/CSS"""
     ui_lang = st.session_state.get("ui_lang", "en")
-    
+    t = get_strings(ui_lang)
+
     with st.sidebar:
         # 0. Logo and Title (Top) - using native components
         _display_logo(ui_lang)
-        
+
         st.divider()
-        
+
         # 1. New Chat Button
-        if st.button("➕ New Chat", use_container_width=True, type="primary"):
+        if st.button(t["new_chat"], use_container_width=True, type="primary"):
             create_new_chat()
         
         st.divider()
@@ -32,123 +43,142 @@ def display_sidebar():
         _display_user_profile()
 
 
-def _display_logo(ui_lang: str):
-    """Display app logo and title using native Streamlit components
-    
+@lru_cache(maxsize=4)
+def _logo_html(ui_lang: str) -> str:
+    """Build the logo/title HTML once per UI language
+
     Args:
         ui_lang: Current UI language ('en' or 'vi')
+
+    Returns:
+        HTML string for the sidebar header
     """
-    title_text = "Vietnam Travel" if ui_lang == "en" else "Du Lịch Việt Nam"
-    subtitle_text = "Your AI Travel Assistant" if ui_lang == "en" else "Trợ Lý Du Lịch AI"
-    
-    # Centered logo with larger emoji using minimal HTML for alignment
-    st.markdown(
-        f"""
+    t = get_strings(ui_lang)
+    return f"""
         <div style='text-align: center;'>
             <div style='font-size: 4rem; line-height: 1.2;'>🇻🇳</div>
-            <div style='font-size: 1.2rem; font-weight: 600; margin-top: 0.5rem;'>{title_text}</div>
-            <div style='font-size: 0.85rem; color: #666; margin-top: 0.25rem;'>{subtitle_text}</div>
+            <div style='font-size: 1.2rem; font-weight: 600; margin-top: 0.5rem;'>{t["sidebar_title"]}</div>
+            <div style='font-size: 0.85rem; color: #666; margin-top: 0.25rem;'>{t["sidebar_subtitle"]}</div>
         </div>
-        """,
-        unsafe_allow_html=True
-    )
+        """
+
+
+def _display_logo(ui_lang: str):
+    """Display app logo and title using native Streamlit components
+
+    Args:
+        ui_lang: Current UI language ('en' or 'vi')
+    """
+    # Centered logo with larger emoji using minimal HTML for alignment
+    st.markdown(_logo_html(ui_lang), unsafe_allow_html=True)
 
 
+@st.fragment
 def _display_chat_history(ui_lang: str):
     """Display chat history section using native components
-    
+
+    Runs as a fragment: hovering/clicking inside the history list reruns
+    only this block. Actions that must repaint the main pane (loading or
+    deleting a session) explicitly escalate via st.rerun(scope="app").
+
     Args:
         ui_lang: Current UI language ('en' or 'vi')
     """
-    if ui_lang == "en":
-        st.subheader("💬 Chat History")
-    else:
-        st.subheader("💬 Lịch sử trò chuyện")
-    
-    # Add minimal CSS to ensure single-line display in sidebar
-    st.markdown("""
-        <style>
-        /* Ensure chat history buttons stay on single line */
-        [data-testid="stSidebar"] button {
-            white-space: nowrap !important;
-            overflow: hidden !important;
-            text-overflow: ellipsis !important;
-        }
-        [data-testid="stSidebar"] button p {
-            white-space: nowrap !important;
-            overflow: hidden !important;
-            text-overflow: ellipsis !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
-    # Display chat history with delete buttons - simplified layout
-    if "chat_sessions" in st.session_state and st.session_state.chat_sessions:
-        for session_id, session_data in reversed(list(st.session_state.chat_sessions.items())[-10:]):
-            # Get first user message as preview
-            preview = session_data.get("preview", "New conversation")
-            
-            # Truncate preview to 22 characters to ensure single line in sidebar
-            if len(preview) > 22:
-                preview = preview[:19] + "..."
-            
-            timestamp = session_data.get("timestamp", "")
-            is_active = session_id == st.session_state.get("current_chat_id")
-            
-            # Create columns: 80% for chat button, 20% for delete button
-            col1, col2 = st.columns([0.8, 0.2])
-            
-            with col1:
-                # Chat button - will be truncated by CSS if still too long
-                button_label = f"{'📌' if is_active else '💬'} {preview}"
-                if st.button(
-                    button_label,
-                    key=f"chat_{session_id}",
-                    use_container_width=True,
-                    help=f"{session_data.get('preview', 'New conversation')}\n{timestamp}"
-                ):
-                    load_chat_session(session_id)
-            
-            with col2:
-                # Delete button
-                if st.button("🗑️", key=f"delete_{session_id}", help="Delete chat"):
-                    delete_chat_session(session_id)
-    else:
-        if ui_lang == "en":
-            st.caption("No chat history yet")
-        else:
-            st.caption("Chưa có lịch sử")
+    t = get_strings(ui_lang)
+    st.subheader(t["chat_history_header"])
+
+    # Single-line truncation rules live in load_custom_css with the rest
+    # of the app CSS; no per-rerun <style> injection here
+
+    # One radio instead of 2 widgets per session: a tenth of the element
+    # protobufs shipped to the frontend on every sidebar rerun.
+    # chat_order is a small most-recent-first deque, so rendering is O(10)
+    # regardless of how many sessions exist
+    chat_order = st.session_state.get("chat_order")
+    chat_sessions = st.session_state.get("chat_sessions", {})
+    options = [sid for sid in chat_order or () if sid in chat_sessions]
+    if not options:
+        st.caption(t["no_history"])
+        return
+
+    current = st.session_state.get("current_chat_id")
+
+    # Labels built once per render and shared by both widgets below;
+    # 22 chars keeps previews on a single sidebar line and the cached
+    # truncation helper makes repeat reruns a dict hit
+    labels = {
+        sid: f"{'📌' if sid == current else '💬'} "
+             f"{truncate_text(chat_sessions[sid].get('preview', 'New conversation'), 22)}"
+        for sid in options
+    }
+
+    selected = st.pills(
+        t["chat_history_header"],
+        options,
+        default=current if current in options else None,
+        format_func=labels.get,
+        label_visibility="collapsed",
+        key="hist_pills"
+    )
+
+    # Only an actual change of selection loads a session; the guard keeps
+    # a stale widget value (e.g. right after New Chat) from re-loading it
+    previous = st.session_state.get("_hist_pills_prev")
+    st.session_state._hist_pills_prev = selected
+    if selected is not None and selected != previous and selected != current:
+        load_chat_session(selected)
+
+    # Full preview + timestamp of the selected chat (the labels above
+    # are truncated). Captions go through markdown, so the user-typed
+    # preview is escaped before rendering.
+    if selected is not None:
+        info = chat_sessions.get(selected, {})
+        if info.get("timestamp"):
+            st.caption(
+                f"{html.escape(info.get('preview', ''))} · {info['timestamp']}"
+            )
+
+    # All delete controls live behind one expander instead of a trash
+    # button per row
+    with st.expander(t["manage_chats"]):
+        to_delete = st.multiselect(
+            t["select_chats"],
+            options,
+            format_func=labels.get,
+            key="hist_delete_select"
+        )
+        if st.button(t["delete_selected"], key="hist_delete_btn") and to_delete:
+            delete_chat_sessions(to_delete)
 
 
+@st.fragment
 def _display_settings(ui_lang: str):
     """Display settings section
-    
+
+    Fragment-scoped; the language switch escalates to a full-app rerun
+    since every pane renders translated strings.
+
     Args:
         ui_lang: Current UI language ('en' or 'vi')
     """
-    settings_label = "⚙️ Settings" if ui_lang == "en" else "⚙️ Cài đặt"
-    with st.expander(settings_label, expanded=False):
+    t = get_strings(ui_lang)
+    with st.expander(t["settings"], expanded=False):
         # UI Language Selection
-        lang_label = "Interface Language" if ui_lang == "en" else "Ngôn ngữ giao diện"
         selected_lang = st.selectbox(
-            lang_label,
+            t["interface_language"],
             ["English", "Tiếng Việt"],
             key="ui_language",
             index=0 if ui_lang == "en" else 1
         )
         if selected_lang != ("English" if ui_lang == "en" else "Tiếng Việt"):
             st.session_state.ui_lang = "en" if selected_lang == "English" else "vi"
-            st.rerun()
+            st.rerun(scope="app")
 
 
-def _display_user_profile():
-    """Display user profile with avatar using minimal HTML for styling"""
-    st.divider()
-    
-    # User profile with circular avatar
-    st.markdown(
-        """
-        <div style='display: flex; align-items: center; gap: 12px; padding: 8px 0;'>
+# Static profile card; the .user-profile class lets the sidebar flex
+# layout in styles.py pin it to the bottom
+_PROFILE_HTML = """
+        <div class='user-profile' style='display: flex; align-items: center; gap: 12px; padding: 8px 0;'>
             <div style='width: 40px; height: 40px; border-radius: 50%; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); display: flex; align-items: center; justify-content: center; color: white; font-weight: bold; font-size: 16px; flex-shrink: 0;'>
                 VT
             </div>
@@ -161,7 +191,11 @@ def _display_user_profile():
                 </div>
             </div>
         </div>
-        """,
-        unsafe_allow_html=True
-    )
+        """
+
+
+def _display_user_profile():
+    """Display user profile with avatar using minimal HTML for styling"""
+    st.divider()
+    st.markdown(_PROFILE_HTML, unsafe_allow_html=True)
 
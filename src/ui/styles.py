@@ -3,15 +3,45 @@
 import streamlit as st
 
 
-def load_custom_css():
-    """Load minimal CSS - using native Streamlit styling to avoid deployment issues"""
-    # Minimal CSS only for essential fixes - no custom HTML/JS needed
-    st.markdown("""
+# CSS is static, so build the HTML blob once at import time
+_CSS_HTML = """
     <style>
     /* Hide Streamlit branding only - keep everything else native */
     #MainMenu {visibility: hidden;}
     footer {visibility: hidden;}
     header {visibility: hidden;}
+
+    /* Flex column sidebar: the user profile is pushed to the bottom by
+       CSS instead of spacer elements rendered on every rerun */
+    [data-testid="stSidebar"] > div:first-child {
+        display: flex;
+        flex-direction: column;
+        height: 100vh;
+    }
+    .user-profile {
+        margin-top: auto;
+    }
+
+    /* Keep sidebar history labels (pills render as buttons) on a
+       single line, one per row */
+    [data-testid="stSidebar"] button,
+    [data-testid="stSidebar"] button p {
+        white-space: nowrap !important;
+        overflow: hidden !important;
+        text-overflow: ellipsis !important;
+    }
+    [data-testid="stSidebar"] [data-testid="stPills"] button {
+        width: 100%;
+        justify-content: flex-start;
+    }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+
+def load_custom_css():
+    """Load minimal CSS - using native Streamlit styling to avoid deployment issues"""
+    # NOTE: the <style> element must be re-emitted on every app rerun;
+    # Streamlit prunes elements that are skipped, which would un-hide the
+    # branding again. Only the string build is hoisted out of the run.
+    st.markdown(_CSS_HTML, unsafe_allow_html=True)
 
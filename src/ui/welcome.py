@@ -1,36 +1,43 @@
 """Welcome Screen Component"""
 
+import urllib.parse
+from types import MappingProxyType
+
 import streamlit as st
 
+from .i18n import get_strings
 
-def display_welcome_screen():
-    """Display welcome screen with example questions in main area"""
-    ui_lang = st.session_state.get("ui_lang", "en")
-    
-    # Title - using native Streamlit components only
-    if ui_lang == "en":
-        st.title("🇻🇳 Welcome to Vietnam Travel Chatbot")
-        st.subheader("Your AI-powered Vietnamese travel assistant")
-    else:
-        st.title("🇻🇳 Chào mừng đến với Vietnam Travel Chatbot")
-        st.subheader("Trợ lý du lịch Việt Nam được hỗ trợ bởi AI")
-    
-    st.divider()
-    
-    # Example questions in grid - using native Streamlit components
-    examples = _get_example_questions(ui_lang)
-    
-    # Display examples in 2x2 grid with styled cards
-    col1, col2 = st.columns(2, gap="medium")
-    
-    for i, example in enumerate(examples):
-        col = col1 if i % 2 == 0 else col2
-        
-        with col:
-            # Card with tag and subtext (info only, not clickable)
-            st.markdown(
-                f"""
-                <div style='padding: 16px; background-color: #f7f7f8; border-radius: 12px; border: 1px solid #e5e5e5; margin-bottom: 12px;'>
+
+# Example questions are static per language, so build them (and their
+# card HTML) once at import time instead of on every rerun. Frozen as
+# tuples of read-only mappings: the grid HTML below is derived from
+# them, so silent mutation elsewhere could desync the two.
+_EXAMPLES = {
+    "en": tuple(MappingProxyType(e) for e in (
+        {"icon": "🏖️", "title": "Destinations", "text": "What's the best time to visit Ha Long Bay?"},
+        {"icon": "🍜", "title": "Food", "text": "Recommend good pho restaurants in Hanoi"},
+        {"icon": "🎭", "title": "Culture", "text": "Tell me about Vietnamese water puppetry"},
+        {"icon": "🗺️", "title": "Travel Tips", "text": "How do I get around in Saigon?"},
+    )),
+    "vi": tuple(MappingProxyType(e) for e in (
+        {"icon": "🏖️", "title": "Điểm đến", "text": "Thời tiết ở Sa Pa tháng 12 như thế nào?"},
+        {"icon": "🍜", "title": "Ẩm thực", "text": "Gợi ý quán bún chả ngon ở Hà Nội"},
+        {"icon": "🎭", "title": "Văn hóa", "text": "Tết Nguyên Đán là gì?"},
+        {"icon": "🗺️", "title": "Thông tin", "text": "Cần visa để đến Việt Nam không?"},
+    )),
+}
+
+# All four cards ship as one markdown element: a 2x2 CSS grid in a
+# single HTML blob. Each card is a plain ?q= link — no widget
+# registrations, so a click is one rerun carrying the prefilled query
+# instead of a button-callback round trip.
+_GRID_HTML = {
+    lang: (
+        "<div style='display: grid; grid-template-columns: 1fr 1fr; gap: 12px; margin-bottom: 16px;'>"
+        + "".join(
+            f"""
+                <a href='?q={urllib.parse.quote(example['text'])}' target='_self' style='text-decoration: none; color: inherit;'>
+                <div style='padding: 16px; background-color: #f7f7f8; border-radius: 12px; border: 1px solid #e5e5e5; cursor: pointer;'>
                     <div style='font-size: 16px; font-weight: 600; color: #1f1f1f; margin-bottom: 8px;'>
                         {example['icon']} {example['title']}
                     </div>
@@ -38,45 +45,33 @@ def display_welcome_screen():
                         {example['text']}
                     </div>
                 </div>
-                """,
-                unsafe_allow_html=True
-            )
-            
-            # Action button below card - native Streamlit (secondary type for neutral colors)
-            if st.button(
-                example['text'],
-                key=f"example_{i}",
-                use_container_width=True,
-                type="secondary"
-            ):
-                st.session_state.current_input = example['text']
-                st.rerun()
-            
-            # Spacing between card groups
-            st.markdown("<div style='margin-bottom: 24px;'></div>", unsafe_allow_html=True)
+                </a>
+                """
+            for example in examples
+        )
+        + "</div>"
+    )
+    for lang, examples in _EXAMPLES.items()
+}
 
 
-def _get_example_questions(ui_lang: str) -> list:
-    """Get example questions based on UI language
-    
-    Args:
-        ui_lang: Current UI language ('en' or 'vi')
-        
-    Returns:
-        List of example question dictionaries
-    """
-    if ui_lang == "en":
-        return [
-            {"icon": "🏖️", "title": "Destinations", "text": "What's the best time to visit Ha Long Bay?"},
-            {"icon": "🍜", "title": "Food", "text": "Recommend good pho restaurants in Hanoi"},
-            {"icon": "🎭", "title": "Culture", "text": "Tell me about Vietnamese water puppetry"},
-            {"icon": "🗺️", "title": "Travel Tips", "text": "How do I get around in Saigon?"},
-        ]
-    else:
-        return [
-            {"icon": "🏖️", "title": "Điểm đến", "text": "Thời tiết ở Sa Pa tháng 12 như thế nào?"},
-            {"icon": "🍜", "title": "Ẩm thực", "text": "Gợi ý quán bún chả ngon ở Hà Nội"},
-            {"icon": "🎭", "title": "Văn hóa", "text": "Tết Nguyên Đán là gì?"},
-            {"icon": "🗺️", "title": "Thông tin", "text": "Cần visa để đến Việt Nam không?"},
-        ]
+def display_welcome_screen():
+    """Display welcome screen with example questions in main area"""
+    ui_lang = st.session_state.get("ui_lang", "en")
+
+    # One-shot prefill: a card click lands here with ?q=..., which seeds
+    # the next input and is cleared so reloads don't resubmit it
+    prefill = st.query_params.get("q")
+    if prefill:
+        st.session_state.current_input = prefill
+        st.query_params.clear()
+
+    # Title - using native Streamlit components only
+    t = get_strings(ui_lang)
+    st.title(t["welcome_title"])
+    st.subheader(t["welcome_subtitle"])
+
+    st.divider()
 
+    # Example cards: one markdown element, zero widgets
+    st.markdown(_GRID_HTML.get(ui_lang, _GRID_HTML["en"]), unsafe_allow_html=True)
@@ -1,28 +1,39 @@
 """Utility Functions"""
 
 import os
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, Any, Optional
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def load_env_file(env_path: str = ".env") -> bool:
     """Load environment variables from .env file
-    
+
+    Parsed exactly once per process: Streamlit reruns the script on
+    every interaction, and re-parsing the file each time is pure
+    overhead. Values already present in the environment win over the
+    file, matching load_dotenv's default.
+
     Args:
         env_path: Path to .env file
-        
+
     Returns:
         True if loaded successfully
     """
-    from dotenv import load_dotenv
-    
-    if os.path.exists(env_path):
-        load_dotenv(env_path)
-        return True
-    else:
+    from dotenv import dotenv_values
+
+    values = dotenv_values(env_path)
+    if not values:
         print(f"Warning: {env_path} not found")
         return False
 
+    for key, value in values.items():
+        if value is not None and key not in os.environ:
+            os.environ[key] = value
+    return True
+
 
 def validate_environment(verbose: bool = True) -> Dict[str, bool]:
     """Validate required environment variables
@@ -47,87 +58,102 @@ def validate_environment(verbose: bool = True) -> Dict[str, bool]:
         "Azure OpenAI Embedding Endpoint": "AZURE_OPENAI_EMBEDDING_ENDPOINT",
     }
     
-    results = {}
-    
-    # Validate required vars
-    for name, var in required_vars.items():
-        value = os.getenv(var)
-        is_set = value is not None and len(value) > 0
-        results[var] = is_set
-        if verbose:
-            status = "[OK] Set" if is_set else "[MISSING]"
-            print(f"{name}: {status}")
-    
-    # Validate optional vars (silent unless verbose)
-    for name, var in optional_vars.items():
-        value = os.getenv(var)
-        is_set = value is not None and len(value) > 0
-        results[var] = is_set
-    
-    if verbose and any(results.get(var, False) for var in optional_vars.values()):
-        print("\nOptional Variables:")
-        for name, var in optional_vars.items():
-            if results.get(var, False):
-                print(f"{name}: [OK] Set")
-    
+    # One environment snapshot, one pass: truthiness covers both the
+    # unset and empty-string cases
+    env = os.environ
+    results = {
+        var: bool(env.get(var))
+        for var in (*required_vars.values(), *optional_vars.values())
+    }
+
+    if verbose:
+        print("\n".join(
+            f"{name}: {'[OK] Set' if results[var] else '[MISSING]'}"
+            for name, var in required_vars.items()
+        ))
+        if any(results[var] for var in optional_vars.values()):
+            print("\nOptional Variables:")
+            print("\n".join(
+                f"{name}: [OK] Set"
+                for name, var in optional_vars.items() if results[var]
+            ))
+
     return results
 
 
+# Resolved once per process; __file__ never changes after import
+_PROJECT_ROOT: Path = Path(__file__).resolve().parent.parent
+
+
 def get_project_root() -> Path:
     """Get project root directory
-    
+
     Returns:
         Path to project root
     """
-    return Path(__file__).parent.parent
+    return _PROJECT_ROOT
 
 
 def ensure_directories():
-    """Ensure all required directories exist"""
+    """Ensure all required directories exist
+
+    A sentinel file short-circuits repeat calls: after the first run the
+    cost is one stat instead of a mkdir (and a print) per directory.
+    """
     root = get_project_root()
-    
+    sentinel = root / ".dirs_ready"
+    if sentinel.exists():
+        return
+
     directories = [
         root / "data" / "raw" / "vietnamese",
         root / "data" / "raw" / "english",
     ]
-    
+
     for directory in directories:
         directory.mkdir(parents=True, exist_ok=True)
         print(f"Directory ensured: {directory}")
+    sentinel.touch()
+
+
+# Error-message templates, formatted per call with just the error text
+_ERR_VI = "❌ Xin lỗi, đã xảy ra lỗi: {e}\n\nVui lòng thử lại hoặc đặt câu hỏi khác."
+_ERR_EN = "❌ Sorry, an error occurred: {e}\n\nPlease try again or ask a different question."
 
 
 def format_error_message(error: Exception, language: str = "english") -> str:
     """Format error message for display
-    
+
     Args:
         error: Exception object
         language: Language for the message
-        
+
     Returns:
         Formatted error message
     """
-    error_str = str(error)
-    
-    if language == "vietnamese":
-        return f"❌ Xin lỗi, đã xảy ra lỗi: {error_str}\n\nVui lòng thử lại hoặc đặt câu hỏi khác."
-    else:
-        return f"❌ Sorry, an error occurred: {error_str}\n\nPlease try again or ask a different question."
+    template = _ERR_VI if language == "vietnamese" else _ERR_EN
+    return template.format_map({"e": error})
+
+
+@lru_cache(maxsize=256)
+def _trunc(text: str, max_length: int) -> str:
+    """Cached truncation; sidebar previews repeat every rerun"""
+    if len(text) <= max_length:
+        return text
+    return text[:max_length - 3] + "..."
 
 
 def truncate_text(text: str, max_length: int = 500) -> str:
-    """Truncate text to maximum length
-    
+    """Truncate text to maximum length, ellipsis included
+
     Args:
         text: Text to truncate
-        max_length: Maximum length
-        
+        max_length: Maximum length of the result
+
     Returns:
         Truncated text
     """
-    if len(text) <= max_length:
-        return text
-    
-    return text[:max_length] + "..."
+    return _trunc(text, max_length)
 
 
 def count_tokens_approximate(text: str) -> int:
@@ -156,15 +182,14 @@ def format_sources(sources: list, max_sources: int = 3) -> str:
     """
     if not sources:
         return ""
-    
-    result = "\n\n---\n**Sources:**\n"
-    
-    for i, doc in enumerate(sources[:max_sources], 1):
-        metadata = doc.metadata
-        category = metadata.get("category", "general")
-        language = metadata.get("language", "unknown")
-        
-        result += f"{i}. {category.title()} ({language})\n"
-    
-    return result
+
+    # Single join, islice instead of a slice copy: lazy end to end
+    return "".join((
+        "\n\n---\n**Sources:**\n",
+        *(
+            f"{i}. {m.get('category', 'general').title()} ({m.get('language', 'unknown')})\n"
+            for i, doc in enumerate(islice(sources, max_sources), 1)
+            for m in (doc.metadata,)
+        ),
+    ))
 
@@ -1,33 +1,286 @@
 """Pinecone Vector Store Management"""
 
+import hashlib
 import os
-from typing import List, Optional
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
+from typing import List, Optional, Tuple
+
+import numpy as np
 from pinecone import Pinecone, ServerlessSpec
 from langchain_pinecone import PineconeVectorStore
 from langchain_openai import AzureOpenAIEmbeddings
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.schema import Document
 
+try:
+    # Optional: native SIMD-accelerated chunking; falls back to the
+    # pure-Python LangChain splitter when not installed
+    from chonkie import FastChunker
+except ImportError:
+    FastChunker = None
+
+
+# Filename-substring -> category rules, checked in order; first match
+# wins, "general" if none do
+_CATEGORY_RULES = (
+    ("destinations", "destinations"),
+    ("food", "food"),
+    ("culture", "culture"),
+)
+
+# Control-plane readiness polling: check every half second, give up
+# after a minute (cold regions can be slow)
+_READY_POLL_INTERVAL = 0.5
+_READY_TIMEOUT = 60.0
+
+# Query cache: cosine similarity a cached query embedding must reach to
+# stand in for a fresh Pinecone round-trip, and how many recent queries
+# are kept
+_QCACHE_THRESHOLD = 0.97
+_QCACHE_SIZE = 32
+
+# Pinecone recommends batches of ~100 vectors per upsert request
+UPSERT_BATCH_SIZE = 100
+# Threads backing async_req upserts; concurrent HTTP round-trips are
+# what makes bulk ingestion fast
+UPSERT_POOL_THREADS = 30
+
+
+@lru_cache(maxsize=8)
+def _get_splitter(chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+    """Shared splitter per (chunk_size, chunk_overlap)
+
+    Construction compiles the separator chain; per-language/per-category
+    chunking passes reuse one instance instead of rebuilding it.
+    """
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        length_function=len,
+        separators=["\n\n## ", "\n\n", "\n", " ", ""]
+    )
+
+
+def _split_one(args: Tuple[Document, int, int]) -> List[Document]:
+    """Split a single document; module-level so process pools can pickle it"""
+    doc, chunk_size, chunk_overlap = args
+    return _get_splitter(chunk_size, chunk_overlap).split_documents([doc])
+
+
+def _quantize_int8(vector: List[float]) -> Tuple[np.ndarray, float]:
+    """Scalar-quantize a vector to int8 with a per-vector scale
+
+    Quantization is symmetric (scale only, no zero point) on purpose:
+    cosine similarity is invariant under positive scaling but not under
+    the additive offset an affine scheme would introduce, so stored
+    int8 values rank against float queries with only rounding noise.
+
+    Returns:
+        (int8 array, scale) such that values * scale recovers the
+        original floats to within one quantization step
+    """
+    v = np.asarray(vector, dtype=np.float32)
+    scale = float(np.abs(v).max()) / 127.0 or 1.0
+    q = np.clip(np.round(v / scale), -127, 127).astype(np.int8)
+    return q, scale
+
+
+def dequantize_int8(values, scale: float) -> np.ndarray:
+    """Recover float32 values from int8 scalar quantization"""
+    return np.asarray(values, dtype=np.float32) * scale
+
+
+def _content_id(text: str) -> str:
+    """Stable hex ID for a chunk's content
+
+    blake2b is the stdlib's fast keyed hash (already used for the
+    follow-up cache keys); 16 bytes is plenty against collisions at
+    corpus scale. Identical content always maps to the same vector ID,
+    so re-ingesting overwrites in place instead of piling up duplicates.
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _batched(iterable, n: int):
+    """Yield successive tuples of up to n items from iterable"""
+    it = iter(iterable)
+    while batch := tuple(islice(it, n)):
+        yield batch
+
+
+@lru_cache(maxsize=4)
+def _pinecone_client(api_key: str) -> Pinecone:
+    """Shared Pinecone client per API key
+
+    Repeated VectorStoreManager construction (one per worker/request in
+    server contexts) reuses the same client and its connection pool
+    instead of opening fresh connections each time.
+    """
+    return Pinecone(api_key=api_key)
+
+
+@lru_cache(maxsize=4)
+def _embeddings_for(deployment: str, model: str, api_version: Optional[str],
+                    endpoint: Optional[str], api_key: str,
+                    dimensions: Optional[int]) -> AzureOpenAIEmbeddings:
+    """Shared embeddings client per (deployment, endpoint) config"""
+    # IMPORTANT: Set both azure_deployment AND model to ensure correct model is used
+    # azure_deployment = your deployment name in Azure Portal
+    # model = actual model name (e.g., text-embedding-3-small)
+    kwargs = dict(
+        azure_deployment=deployment,
+        model=model,
+        openai_api_version=api_version,
+        azure_endpoint=endpoint,
+        api_key=api_key
+    )
+    # text-embedding-3-* models support server-side dimension
+    # truncation; only request it when explicitly configured so older
+    # deployments keep working
+    if dimensions:
+        kwargs["dimensions"] = dimensions
+    return AzureOpenAIEmbeddings(**kwargs)
+
+
+# Files above this size are streamed in blocks instead of read whole;
+# below it a single read() is both faster and simpler
+_STREAM_THRESHOLD = 1 << 20
+_READ_BLOCK = 64 * 1024
+
+
+def _iter_file_parts(file_path: str):
+    """Yield a large file as paragraph-aligned parts
+
+    Reads 64 KB blocks and cuts at the last "\\n\\n" in the buffer, so no
+    full-file string is ever materialized and every part ends on a
+    paragraph boundary the splitter would cut at anyway.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        tail = ""
+        while block := f.read(_READ_BLOCK):
+            buffer = tail + block
+            cut = buffer.rfind("\n\n")
+            if cut == -1:
+                tail = buffer
+                continue
+            yield buffer[:cut]
+            tail = buffer[cut + 2:]
+        if tail:
+            yield tail
+
+
+def _read_one(file_path: str) -> Optional[Tuple[str, Tuple[str, ...]]]:
+    """Read one document file as (path, content parts), or None if missing
+
+    Small files come back as a single part; files over _STREAM_THRESHOLD
+    are streamed into paragraph-aligned parts to keep peak memory flat.
+    """
+    if not os.path.exists(file_path):
+        print(f"Warning: File not found: {file_path}")
+        return None
+    if os.path.getsize(file_path) > _STREAM_THRESHOLD:
+        return file_path, tuple(_iter_file_parts(file_path))
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return file_path, (f.read(),)
+
+
+class CachedEmbeddingRetriever:
+    """Retriever that embeds each query once across sibling retrievers
+
+    When a chain fans one query out to several retrievers (e.g. one per
+    language filter), each LangChain retriever would re-embed the same
+    text. Retrievers built by get_retriever share a single query->vector
+    cache on their manager, so the ensemble pays for exactly one
+    embedding call per query. Duck-typed to the retriever interface the
+    chains use (invoke/ainvoke/get_relevant_documents).
+    """
+
+    def __init__(self, manager: "VectorStoreManager", k: int = 3,
+                 filter: Optional[dict] = None, qvec_cache: Optional[dict] = None):
+        self.manager = manager
+        self.k = k
+        self.filter = filter
+        # Holds only the most recent query; enough to dedupe within one
+        # request without growing unbounded
+        self._qvec_cache = qvec_cache if qvec_cache is not None else {}
+
+    def _remember(self, query: str, vector: List[float]) -> List[float]:
+        self._qvec_cache.clear()
+        self._qvec_cache[query] = vector
+        return vector
+
+    def get_relevant_documents(self, query: str) -> List[Document]:
+        vector = self._qvec_cache.get(query)
+        if vector is None:
+            vector = self._remember(
+                query, self.manager.embeddings.embed_query(query))
+        return self.manager.similarity_search_by_vector(
+            vector, k=self.k, filter=self.filter)
+
+    def invoke(self, input, config=None, **kwargs) -> List[Document]:
+        query = input if isinstance(input, str) else str(input)
+        return self.get_relevant_documents(query)
+
+    async def ainvoke(self, input, config=None, **kwargs) -> List[Document]:
+        query = input if isinstance(input, str) else str(input)
+        vector = self._qvec_cache.get(query)
+        if vector is None:
+            vector = self._remember(
+                query, await self.manager.embeddings.aembed_query(query))
+        return self.manager.similarity_search_by_vector(
+            vector, k=self.k, filter=self.filter)
+
 
 class VectorStoreManager:
     """Manages Pinecone vector store operations"""
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, dimension: Optional[int] = None,
+                 model: Optional[str] = None):
         """Initialize Pinecone client and embeddings
-        
+
+        Smaller vectors cut storage and per-query bandwidth roughly
+        linearly: text-embedding-3-small truncated to 512 dims keeps
+        nearly all of its retrieval quality at a third of the 1536-dim
+        footprint. Set EMBEDDING_DIMENSIONS (or pass dimension=) only
+        together with an index created at that size.
+
         Args:
             verbose: If True, print initialization details
+            dimension: Embedding/index dimension; defaults to the
+                EMBEDDING_DIMENSIONS env var, else the model's native
+                size (1536)
+            model: Underlying embedding model name; defaults to the
+                deployment name
         """
         self.api_key = os.getenv("PINECONE_API_KEY")
         self.environment = os.getenv("PINECONE_ENVIRONMENT")
         self.index_name = os.getenv("PINECONE_INDEX_NAME", "vietnam-travel")
+
+        env_dim = os.getenv("EMBEDDING_DIMENSIONS")
+        self.dimension = dimension or (int(env_dim) if env_dim else 1536)
+
+        # Opt-in scalar quantization of stored vectors: symmetric int8
+        # values cut upsert payloads ~4x and, being a pure scaling, keep
+        # cosine ranking intact up to rounding noise. Applied
+        # client-side — the installed Pinecone SDK has no server-side
+        # quantization spec (see _quantize_int8/dequantize_int8).
+        self.quantize_int8 = (
+            os.getenv("EMBEDDING_QUANTIZE_INT8", "false").lower() == "true"
+        )
+        # Server-side truncation is only requested for non-native sizes
+        self._truncate_to = self.dimension if self.dimension != 1536 else None
         
         if not self.api_key:
             raise ValueError("PINECONE_API_KEY not found in environment variables")
         
-        # Initialize Pinecone client
-        self.pc = Pinecone(api_key=self.api_key)
-        
+        # Initialize Pinecone client (process-wide, shared across
+        # manager instances)
+        self.pc = _pinecone_client(self.api_key)
+
         # Initialize embeddings
         # Use separate API key for embeddings if available, otherwise fallback to main API key
         embedding_api_key = os.getenv("AZURE_OPENAI_EMBEDDING_API_KEY") or os.getenv("AZURE_OPENAI_API_KEY")
@@ -43,48 +296,76 @@ class VectorStoreManager:
         if verbose:
             print(f"[VectorStore] Using embedding deployment: {embedding_deployment}")
         
-        # IMPORTANT: Set both azure_deployment AND model to ensure correct model is used
-        # azure_deployment = your deployment name in Azure Portal
-        # model = actual model name (e.g., text-embedding-3-small)
-        self.embeddings = AzureOpenAIEmbeddings(
-            azure_deployment=embedding_deployment,
-            model=embedding_deployment,  # Explicitly set model name to match deployment
-            openai_api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
-            azure_endpoint=embedding_endpoint,
-            api_key=embedding_api_key
+        self.embeddings = _embeddings_for(
+            embedding_deployment,
+            model or embedding_deployment,
+            os.getenv("AZURE_OPENAI_API_VERSION"),
+            embedding_endpoint,
+            embedding_api_key,
+            self._truncate_to
         )
         
         self.vectorstore = None
+
+        # Recent (unit query vector, (k, filter) key, results) triples;
+        # near-duplicate queries skip the Pinecone round-trip entirely
+        self._qcache: deque = deque(maxlen=_QCACHE_SIZE)
+
+        # Memoized index-name set; each list_indexes() is a
+        # control-plane HTTP round-trip, so cache it and invalidate on
+        # create/delete
+        self._index_cache: Optional[set] = None
+
+        # Query->vector cache shared by every retriever built from this
+        # manager (see CachedEmbeddingRetriever)
+        self._retriever_qvec_cache: dict = {}
+
+    def _list_indexes(self, refresh: bool = False) -> set:
+        """Get the set of existing index names, cached until a mutation
+
+        Args:
+            refresh: Force a fresh control-plane listing
+
+        Returns:
+            Set of index names
+        """
+        if refresh or self._index_cache is None:
+            self._index_cache = {index.name for index in self.pc.list_indexes()}
+        return self._index_cache
     
     def delete_index(self):
         """Delete the Pinecone index if it exists"""
-        existing_indexes = [index.name for index in self.pc.list_indexes()]
-        
-        if self.index_name in existing_indexes:
+        if self.index_name in self._list_indexes():
             print(f"Deleting existing index '{self.index_name}'...")
             self.pc.delete_index(self.index_name)
+            # Poll until the control plane stops listing the index
+            # instead of sleeping a fixed 5s; each poll refreshes the
+            # cached name set
+            deadline = time.monotonic() + _READY_TIMEOUT
+            while time.monotonic() < deadline:
+                if self.index_name not in self._list_indexes(refresh=True):
+                    break
+                time.sleep(_READY_POLL_INTERVAL)
             print(f"Index '{self.index_name}' deleted successfully!")
-            # Wait for deletion to complete
-            import time
-            time.sleep(5)
         else:
             print(f"Index '{self.index_name}' does not exist, nothing to delete.")
     
-    def create_index_if_not_exists(self, dimension: int = 1536, force_recreate: bool = False):
+    def create_index_if_not_exists(self, dimension: Optional[int] = None,
+                                   force_recreate: bool = False):
         """Create Pinecone index if it doesn't exist
-        
+
         Args:
-            dimension: Vector dimension (1536 for text-embedding-3-small)
+            dimension: Vector dimension; defaults to the manager's
+                configured dimension (1536 native, or EMBEDDING_DIMENSIONS)
             force_recreate: If True, delete and recreate the index even if it exists
         """
-        existing_indexes = [index.name for index in self.pc.list_indexes()]
-        
-        if force_recreate and self.index_name in existing_indexes:
+        dimension = dimension or self.dimension
+
+        if force_recreate and self.index_name in self._list_indexes():
             print(f"Force recreate enabled. Deleting existing index '{self.index_name}'...")
             self.delete_index()
-            existing_indexes = []
-        
-        if self.index_name not in existing_indexes:
+
+        if self.index_name not in self._list_indexes():
             print(f"Creating index '{self.index_name}'...")
             self.pc.create_index(
                 name=self.index_name,
@@ -95,10 +376,16 @@ class VectorStoreManager:
                     region=self.environment or "us-east-1"
                 )
             )
+            # Wait only as long as the index actually takes to come up,
+            # not a fixed 10s
+            deadline = time.monotonic() + _READY_TIMEOUT
+            while time.monotonic() < deadline:
+                if self.pc.describe_index(self.index_name).status["ready"]:
+                    break
+                time.sleep(_READY_POLL_INTERVAL)
+            if self._index_cache is not None:
+                self._index_cache.add(self.index_name)
             print(f"Index '{self.index_name}' created successfully!")
-            # Wait for index to be ready
-            import time
-            time.sleep(10)
         else:
             print(f"Index '{self.index_name}' already exists.")
     
@@ -113,61 +400,179 @@ class VectorStoreManager:
             List of Document objects
         """
         documents = []
-        
-        for file_path in file_paths:
-            if not os.path.exists(file_path):
-                print(f"Warning: File not found: {file_path}")
+
+        if not file_paths:
+            print(f"Loaded 0 documents in {language}")
+            return documents
+
+        # Overlap the file reads: the work is pure I/O, so a thread
+        # pool makes total latency roughly that of the slowest file
+        # instead of the sum of all of them
+        with ThreadPoolExecutor(max_workers=min(32, len(file_paths))) as ex:
+            results = list(ex.map(_read_one, file_paths))
+
+        for result in results:
+            if result is None:
                 continue
-            
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Determine category from filename
-            category = "general"
-            if "destinations" in file_path.lower():
-                category = "destinations"
-            elif "food" in file_path.lower():
-                category = "food"
-            elif "culture" in file_path.lower():
-                category = "culture"
-            
-            # Create document with metadata
-            doc = Document(
-                page_content=content,
-                metadata={
-                    "source": file_path,
-                    "language": language,
-                    "category": category
-                }
+            file_path, parts = result
+
+            # Determine category from filename (lowercased once)
+            lowered = file_path.lower()
+            category = next(
+                (cat for key, cat in _CATEGORY_RULES if key in lowered),
+                "general"
             )
-            documents.append(doc)
-        
+
+            # One Document per part; small files have exactly one, large
+            # files arrive pre-cut at paragraph boundaries
+            for content in parts:
+                documents.append(Document(
+                    page_content=content,
+                    metadata={
+                        "source": file_path,
+                        "language": language,
+                        "category": category
+                    }
+                ))
+
         print(f"Loaded {len(documents)} documents in {language}")
         return documents
     
-    def chunk_documents(self, documents: List[Document], chunk_size: int = 1000, 
-                       chunk_overlap: int = 200) -> List[Document]:
+    def chunk_documents(self, documents: List[Document], chunk_size: int = 1000,
+                       chunk_overlap: int = 200, fast: bool = True) -> List[Document]:
         """Split documents into chunks
-        
+
+        When the optional chonkie package is installed and fast=True,
+        boundary detection runs through its native-accelerated chunker
+        instead of LangChain's pure-Python splitter; chunk offsets are
+        recorded in metadata so downstream deduplication can map chunks
+        back to their source spans.
+
         Args:
             documents: List of documents to chunk
             chunk_size: Size of each chunk
             chunk_overlap: Overlap between chunks
-            
+            fast: Use the chonkie chunker when available
+
         Returns:
             List of chunked documents
         """
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            length_function=len,
-            separators=["\n\n## ", "\n\n", "\n", " ", ""]
-        )
-        
-        chunks = text_splitter.split_documents(documents)
+        if fast and FastChunker is not None:
+            chunker = FastChunker(chunk_size=chunk_size, delimiters="\n\n")
+            chunks = [
+                Document(
+                    page_content=piece.text,
+                    metadata={
+                        **doc.metadata,
+                        "start_offset": piece.start_index,
+                        "end_offset": piece.end_index,
+                    },
+                )
+                for doc in documents
+                for piece in chunker.chunk(doc.page_content)
+            ]
+            print(f"Split into {len(chunks)} chunks")
+            return chunks
+
+        if len(documents) > 4:
+            # Pure-Python splitting holds the GIL, so fan the documents
+            # out across cores; order is preserved by map
+            with ProcessPoolExecutor() as ex:
+                nested = ex.map(
+                    _split_one,
+                    [(doc, chunk_size, chunk_overlap) for doc in documents],
+                    chunksize=4
+                )
+                chunks = list(chain.from_iterable(nested))
+        else:
+            chunks = _get_splitter(chunk_size, chunk_overlap).split_documents(documents)
         print(f"Split into {len(chunks)} chunks")
         return chunks
     
+    def _embed_in_batches(self, texts: List[str],
+                          max_inputs: int = 16,
+                          max_chars: int = 150_000) -> List[List[float]]:
+        """Embed texts in adaptively sized multi-input batches
+
+        Azure OpenAI accepts multiple inputs per embeddings request, so
+        batching cuts HTTP round-trips (and 429s) by an order of
+        magnitude. Batches are capped both by input count and by total
+        character count so a run of long chunks cannot blow the request
+        size limit.
+
+        Args:
+            texts: Texts to embed
+            max_inputs: Maximum inputs per request
+            max_chars: Maximum total characters per request
+
+        Returns:
+            One embedding vector per input text, in order
+        """
+        import openai
+
+        vectors: List[List[float]] = []
+        batch: List[str] = []
+        batch_chars = 0
+
+        def _flush():
+            nonlocal batch, batch_chars
+            if not batch:
+                return
+            try:
+                vectors.extend(self.embeddings.embed_documents(batch))
+            except openai.BadRequestError:
+                # Deployment rejected the multi-input request (e.g.
+                # "Too many inputs"); degrade to one input per call
+                for text in batch:
+                    vectors.extend(self.embeddings.embed_documents([text]))
+            batch = []
+            batch_chars = 0
+
+        for text in texts:
+            if batch and (len(batch) >= max_inputs
+                          or batch_chars + len(text) > max_chars):
+                _flush()
+            batch.append(text)
+            batch_chars += len(text)
+        _flush()
+
+        return vectors
+
+    def dedupe_chunks(self, chunks: List[Document]) -> List[Document]:
+        """Drop chunks whose content was already seen
+
+        Repeated paragraphs (boilerplate headers, shared disclaimers)
+        would otherwise pay for an embedding call and a vector each per
+        occurrence. The first occurrence is kept as canonical; the
+        sources of dropped duplicates are recorded on it under
+        metadata["aliases"].
+
+        Args:
+            chunks: Chunked documents, in ingestion order
+
+        Returns:
+            Unique chunks, original order preserved
+        """
+        seen: dict = {}
+        unique: List[Document] = []
+
+        for chunk in chunks:
+            content_id = _content_id(chunk.page_content)
+            canonical = seen.get(content_id)
+            if canonical is None:
+                seen[content_id] = chunk
+                unique.append(chunk)
+                continue
+            source = chunk.metadata.get("source")
+            if source and source != canonical.metadata.get("source"):
+                canonical.metadata.setdefault("aliases", []).append(source)
+
+        dropped = len(chunks) - len(unique)
+        if dropped:
+            print(f"Deduplicated {dropped} repeated chunks "
+                  f"({len(unique)} unique remain)")
+        return unique
+
     def ingest_documents(self, documents: List[Document]):
         """Ingest documents into Pinecone
         
@@ -179,16 +584,55 @@ class VectorStoreManager:
             return
         
         print(f"Ingesting {len(documents)} documents into Pinecone...")
-        
-        # Create vector store and ingest
-        self.vectorstore = PineconeVectorStore.from_documents(
-            documents=documents,
-            embedding=self.embeddings,
-            index_name=self.index_name
+
+        # Embed all chunks up front in adaptive batches, then upsert in
+        # parallel: async_req hands each batch to the client's thread
+        # pool so the HTTP round-trips overlap instead of running
+        # serially
+        vectors = self._embed_in_batches(
+            [doc.page_content for doc in documents]
         )
-        
+        if vectors and len(vectors[0]) != self.dimension:
+            raise ValueError(
+                f"Embedding dimension {len(vectors[0])} does not match "
+                f"configured index dimension {self.dimension}"
+            )
+
+        payload = (
+            self._vector_payload(doc, vector)
+            for doc, vector in zip(documents, vectors)
+        )
+
+        index = self.pc.Index(self.index_name, pool_threads=UPSERT_POOL_THREADS)
+        async_results = [
+            index.upsert(vectors=list(batch), async_req=True)
+            for batch in _batched(payload, UPSERT_BATCH_SIZE)
+        ]
+        # Block until every batch has landed; get() re-raises failures
+        for result in async_results:
+            result.get()
+
         print("Documents ingested successfully!")
     
+    def _vector_payload(self, doc: Document, vector: List[float]) -> tuple:
+        """Build one (id, values, metadata) upsert tuple
+
+        Stores the chunk text under the "text" metadata key so
+        PineconeVectorStore can reconstruct Documents on search. The
+        embedding itself never goes into metadata — Pinecone metadata
+        only allows scalars and lists of strings, and a float list would
+        blow the 40KB cap anyway; rerank() takes its vectors from
+        query(include_values=True)/fetch instead. With quantization
+        enabled the stored values are int8, with scale/zero_point
+        recorded for dequantization.
+        """
+        metadata = {"text": doc.page_content, **doc.metadata}
+        if self.quantize_int8:
+            quantized, scale = _quantize_int8(vector)
+            vector = quantized.tolist()
+            metadata["embedding_scale"] = scale
+        return _content_id(doc.page_content), vector, metadata
+
     def get_vectorstore(self) -> PineconeVectorStore:
         """Get or initialize vector store
         
@@ -203,42 +647,167 @@ class VectorStoreManager:
         
         return self.vectorstore
     
-    def similarity_search(self, query: str, k: int = 3, 
+    def similarity_search(self, query: str, k: int = 3,
                          filter: Optional[dict] = None) -> List[Document]:
-        """Perform similarity search
-        
+        """Perform similarity search with a semantic query cache
+
+        The query is embedded once; if a recently seen query with the
+        same (k, filter) landed within cosine _QCACHE_THRESHOLD of it,
+        the cached neighbors are returned without touching Pinecone.
+
         Args:
             query: Search query
             k: Number of results to return
             filter: Metadata filter (e.g., {"language": "vietnamese"})
-            
+
         Returns:
             List of relevant documents
         """
         vectorstore = self.get_vectorstore()
-        
+
+        qv = np.asarray(self.embeddings.embed_query(query), dtype=np.float32)
+        norm = np.linalg.norm(qv)
+        if norm:
+            qv = qv / norm
+
+        # Only entries with the same k and filter are comparable
+        key = (k, tuple(sorted(filter.items())) if filter else None)
+        candidates = [entry for entry in self._qcache if entry[1] == key]
+        if candidates:
+            sims = np.stack([entry[0] for entry in candidates]) @ qv
+            best = int(np.argmax(sims))
+            if sims[best] >= _QCACHE_THRESHOLD:
+                return list(candidates[best][2])
+
+        # Pass the vector we already have; searching by text would
+        # re-embed the query inside the LangChain wrapper
+        results = self.similarity_search_by_vector(qv.tolist(), k=k, filter=filter)
+
+        self._qcache.append((qv, key, results))
+        return results
+
+    async def asimilarity_search(self, query: str, k: int = 3,
+                                 filter: Optional[dict] = None) -> List[Document]:
+        """Async similarity search sharing the semantic query cache
+
+        Awaiting the embedding and the vector query keeps the event
+        loop free for concurrent retrievers (e.g. one per language
+        filter) instead of serializing their network waits. The two
+        calls themselves stay sequential — the vector query needs the
+        embedding as input.
+
+        Args:
+            query: Search query
+            k: Number of results to return
+            filter: Metadata filter (e.g., {"language": "vietnamese"})
+
+        Returns:
+            List of relevant documents
+        """
+        vectorstore = self.get_vectorstore()
+
+        qv = np.asarray(await self.embeddings.aembed_query(query),
+                        dtype=np.float32)
+        norm = np.linalg.norm(qv)
+        if norm:
+            qv = qv / norm
+
+        key = (k, tuple(sorted(filter.items())) if filter else None)
+        candidates = [entry for entry in self._qcache if entry[1] == key]
+        if candidates:
+            sims = np.stack([entry[0] for entry in candidates]) @ qv
+            best = int(np.argmax(sims))
+            if sims[best] >= _QCACHE_THRESHOLD:
+                return list(candidates[best][2])
+
         if filter:
-            results = vectorstore.similarity_search(query, k=k, filter=filter)
+            results = await vectorstore.asimilarity_search_by_vector(
+                qv.tolist(), k=k, filter=filter)
         else:
-            results = vectorstore.similarity_search(query, k=k)
-        
+            results = await vectorstore.asimilarity_search_by_vector(
+                qv.tolist(), k=k)
+
+        self._qcache.append((qv, key, results))
         return results
+
+    def rerank(self, query_vec: List[float], candidates: List[Document],
+               vectors: List[List[float]], k: int = 3) -> List[Document]:
+        """Re-rank candidate documents by cosine similarity to a query
+
+        Candidate vectors are stacked into one contiguous float32 matrix
+        and scored with a single matrix-vector product, then top-k is
+        selected via argpartition — no per-document Python cosine loops.
+        Vectors come back alongside matches from
+        index.query(..., include_values=True) or index.fetch; rows are
+        L2-normalized here, so int8-quantized values score the same as
+        their float originals.
+
+        Args:
+            query_vec: Query embedding vector
+            candidates: Documents to re-rank
+            vectors: Candidate embeddings, parallel to candidates
+            k: Number of documents to keep
+
+        Returns:
+            Top-k documents, most similar first
+        """
+        if not candidates:
+            return []
+
+        matrix = np.asarray(vectors, dtype=np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+
+        qv = np.asarray(query_vec, dtype=np.float32)
+        norm = np.linalg.norm(qv)
+        if norm:
+            qv = qv / norm
+
+        scores = matrix @ qv
+        if k < len(candidates):
+            top = np.argpartition(-scores, k)[:k]
+            top = top[np.argsort(-scores[top])]
+        else:
+            top = np.argsort(-scores)
+        return [candidates[i] for i in top]
+
+    def similarity_search_by_vector(self, qvec: List[float], k: int = 3,
+                                    filter: Optional[dict] = None) -> List[Document]:
+        """Perform similarity search with an already-computed embedding
+
+        Callers that embed the query themselves (the semantic caches,
+        hybrid rerankers) use this to avoid paying a second embedding
+        round-trip inside the LangChain wrapper.
+
+        Args:
+            qvec: Query embedding vector
+            k: Number of results to return
+            filter: Metadata filter (e.g., {"language": "vietnamese"})
+
+        Returns:
+            List of relevant documents
+        """
+        vectorstore = self.get_vectorstore()
+
+        if filter:
+            return vectorstore.similarity_search_by_vector(qvec, k=k, filter=filter)
+        return vectorstore.similarity_search_by_vector(qvec, k=k)
     
     def get_retriever(self, k: int = 3, filter: Optional[dict] = None):
         """Get retriever for RAG chain
-        
+
+        Returned retrievers share this manager's query->vector cache:
+        an ensemble of N of them embeds each query once instead of N
+        times.
+
         Args:
             k: Number of documents to retrieve
             filter: Metadata filter
-            
+
         Returns:
             Retriever instance
         """
-        vectorstore = self.get_vectorstore()
-        
-        search_kwargs = {"k": k}
-        if filter:
-            search_kwargs["filter"] = filter
-        
-        return vectorstore.as_retriever(search_kwargs=search_kwargs)
+        return CachedEmbeddingRetriever(
+            self, k=k, filter=filter,
+            qvec_cache=self._retriever_qvec_cache
+        )
 
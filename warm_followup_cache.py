@@ -0,0 +1,204 @@
+"""Offline Follow-up Cache Warmer via the Azure OpenAI Batch API
+
+Replays stored chat sessions through the Batch API (half the per-token
+price, 24h completion window) to regenerate follow-up suggestions for
+each session's final turn, then writes them back into the per-session
+metadata files. Reopening a warmed session shows suggestions instantly
+without a live LLM call.
+
+Run it overnight / from cron:
+
+Usage:
+    python warm_followup_cache.py
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.chat_storage import ChatStorageManager
+from src.llm_chain import detect_languages_batch
+from src.utils import load_env_file, validate_environment
+
+
+# How often to poll the batch job and for how long before giving up
+POLL_INTERVAL_SECONDS = 30
+POLL_DEADLINE_SECONDS = 24 * 60 * 60
+
+_BATCH_INPUT_PATH = Path("chat_history") / ".followup_batch.jsonl"
+
+
+def _build_followup_prompt(question: str, answer: str, language: str) -> str:
+    """Build the follow-up suggestion prompt (mirrors LLMChainManager)"""
+    if language == "vietnamese":
+        return f"""Dựa trên câu hỏi và câu trả lời dưới đây, hãy đề xuất 2-3 câu hỏi tiếp theo mà người dùng có thể quan tâm.
+
+Câu hỏi: {question}
+Câu trả lời: {answer}
+
+Trả về CHỈ danh sách các câu hỏi, mỗi câu một dòng, không giải thích thêm."""
+    return f"""Based on the question and answer below, suggest 2-3 follow-up questions the user might be interested in.
+
+Question: {question}
+Answer: {answer}
+
+Return ONLY a list of questions, one per line, without additional explanation."""
+
+
+def _last_turn(messages):
+    """Pick the last user question and assistant answer from a session"""
+    question = answer = None
+    for msg in reversed(messages):
+        if answer is None and msg.get("role") == "assistant":
+            answer = msg.get("content")
+        elif msg.get("role") == "user":
+            question = msg.get("content")
+        if question and answer:
+            return question, answer
+    return None, None
+
+
+def _parse_questions(content: str):
+    """Parse the model output into at most 3 clean questions"""
+    questions = [q.strip() for q in content.split('\n') if q.strip()]
+    questions = [q.lstrip('0123456789.-) ') for q in questions]
+    return questions[:3]
+
+
+def main():
+    """Main cache-warming function"""
+    print("=" * 60)
+    print("Vietnam Travel Chatbot - Follow-up Cache Warming")
+    print("=" * 60)
+
+    # Load environment variables
+    print("\n1. Loading environment variables...")
+    load_env_file()
+
+    # Validate environment
+    print("\n2. Validating environment...")
+    validation_results = validate_environment()
+    required_vars = ["AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT",
+                     "AZURE_OPENAI_DEPLOYMENT_NAME"]
+    missing_vars = [var for var in required_vars if not validation_results.get(var, False)]
+    if missing_vars:
+        print("\n❌ ERROR: Missing required environment variables:")
+        for var in missing_vars:
+            print(f"   - {var}")
+        sys.exit(1)
+    print("✅ All required environment variables are set!")
+
+    # Collect the final turn of every stored session
+    print("\n3. Collecting stored sessions...")
+    storage = ChatStorageManager()
+    index = storage.load_session_index()
+    turns = {}
+    for session_id in index:
+        session = storage.load_session(session_id)
+        if not session:
+            continue
+        question, answer = _last_turn(session.get("messages", []))
+        if question and answer:
+            turns[session_id] = (question, answer)
+    if not turns:
+        print("No sessions with a complete turn found; nothing to warm.")
+        return
+    print(f"✅ {len(turns)} session(s) to warm")
+
+    # Build the batch input file
+    print("\n4. Building batch input file...")
+    deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")
+    languages = detect_languages_batch([q for q, _ in turns.values()])
+    _BATCH_INPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(_BATCH_INPUT_PATH, 'w', encoding='utf-8') as f:
+        for (session_id, (question, answer)), language in zip(turns.items(), languages):
+            task = {
+                "custom_id": session_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": deployment,
+                    "messages": [{
+                        "role": "user",
+                        "content": _build_followup_prompt(question, answer, language)
+                    }],
+                    "max_tokens": 100,
+                    "temperature": 0
+                }
+            }
+            f.write(json.dumps(task, ensure_ascii=False) + "\n")
+    print(f"✅ Wrote {len(turns)} request(s) to {_BATCH_INPUT_PATH}")
+
+    # Submit the batch job
+    print("\n5. Submitting batch job...")
+    from openai import AzureOpenAI
+    client = AzureOpenAI(
+        api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+        api_version=os.getenv("AZURE_OPENAI_API_VERSION")
+    )
+    try:
+        batch_file = client.files.create(
+            file=open(_BATCH_INPUT_PATH, "rb"), purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+    except Exception as e:
+        print(f"❌ Failed to submit batch job: {e}")
+        sys.exit(1)
+    print(f"✅ Batch job submitted: {batch.id}")
+
+    # Poll until the job finishes
+    print("\n6. Waiting for batch completion (polls every "
+          f"{POLL_INTERVAL_SECONDS}s)...")
+    deadline = time.monotonic() + POLL_DEADLINE_SECONDS
+    while True:
+        batch = client.batches.retrieve(batch.id)
+        if batch.status in ("completed", "failed", "expired", "cancelled"):
+            break
+        if time.monotonic() > deadline:
+            print(f"❌ Gave up waiting; batch still {batch.status}")
+            sys.exit(1)
+        time.sleep(POLL_INTERVAL_SECONDS)
+    if batch.status != "completed":
+        print(f"❌ Batch finished with status: {batch.status}")
+        sys.exit(1)
+    print("✅ Batch completed")
+
+    # Write warmed follow-ups back into the per-session metadata
+    print("\n7. Writing follow-ups back to session metadata...")
+    warmed = 0
+    output = client.files.content(batch.output_file_id)
+    for line in output.text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            result = json.loads(line)
+            session_id = result["custom_id"]
+            content = result["response"]["body"]["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, ValueError) as e:
+            print(f"⚠️  Skipping malformed result line: {e}")
+            continue
+        questions = _parse_questions(content)
+        if not questions or session_id not in index:
+            continue
+        meta = {**index[session_id], "followup_questions": questions}
+        if storage.update_meta(session_id, meta):
+            warmed += 1
+    print(f"✅ Warmed follow-ups for {warmed} session(s)")
+
+    print("\n" + "=" * 60)
+    print("✅ FOLLOW-UP CACHE WARMING COMPLETED!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()